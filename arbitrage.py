@@ -0,0 +1,80 @@
+"""
+Vectorized arbitrage engine: ranks buy/sell opportunities across many items and markets at once.
+"""
+import numpy as np
+from config import TARGET_MARKETS, MARKET_FEES
+
+
+def build_price_matrix(results, markets=TARGET_MARKETS):
+    """
+    Turns {item: offers} (offers as returned by fetch_prices) into (items, prices) where
+    prices is an items x markets float array with NaN for markets that have no listing.
+    """
+    column = {m: j for j, m in enumerate(markets)}
+    items = list(results)
+    prices = np.full((len(items), len(markets)), np.nan)
+    for i, item in enumerate(items):
+        for offer in results[item]:
+            j = column.get(offer['site'])
+            if j is not None and not prices[i, j] <= offer['price']:
+                prices[i, j] = offer['price']
+    return items, prices
+
+
+def fee_vector(markets=TARGET_MARKETS, fees=None):
+    """Per-market seller fee in percent, from `fees` or config.MARKET_FEES (missing markets: 0)."""
+    fees = MARKET_FEES if fees is None else fees
+    return np.array([fees.get(m, 0.0) for m in markets], dtype=float)
+
+
+def find_opportunities(items, buy, sell=None, fees=None, top_n=20, markets=TARGET_MARKETS):
+    """
+    Ranks the best buy -> sell opportunity of every item.
+
+    buy:  items x markets ask prices (NaN = not listed).
+    sell: what a sale would fetch - items x markets (sell on that market), a per-item vector
+          or a scalar (your own selling price). Defaults to `buy`, i.e. relisting at the
+          lowest ask on the other markets.
+    fees: seller fee in percent - per market (len(markets)) or a scalar; must be a scalar
+          when `sell` is not per market. Defaults to config.MARKET_FEES.
+    Returns up to top_n dicts sorted by net profit, best first.
+    """
+    buy = np.asarray(buy, dtype=float)
+    if not buy.size: return []
+    sell = buy if sell is None else np.asarray(sell, dtype=float)
+    if fees is None: fees = fee_vector(markets) if sell.ndim == 2 else 0.0
+    fees = np.asarray(fees, dtype=float)
+
+    per_market_sell = sell.ndim == 2
+    if not per_market_sell:
+        if fees.ndim: raise ValueError("a per-market fee table needs per-market sell prices")
+        sell = np.broadcast_to(sell.reshape(-1, 1) if sell.ndim == 1 else sell, (buy.shape[0], 1))
+    net = sell * (1 - fees / 100)
+
+    listed = ~np.isnan(buy).all(axis=1) & ~np.isnan(net).all(axis=1)
+    buy_safe = np.where(np.isnan(buy), np.inf, buy)
+    net_safe = np.where(np.isnan(net), -np.inf, net)
+
+    # profit(i, j) = net[j] - buy[i] is separable, so the best pair is argmin(buy) x argmax(net)
+    rows = np.arange(buy.shape[0])
+    buy_idx = buy_safe.argmin(axis=1)
+    sell_idx = net_safe.argmax(axis=1)
+    buy_price = buy_safe[rows, buy_idx]
+    sell_net = net_safe[rows, sell_idx]
+    profit = np.where(listed, sell_net - buy_price, -np.inf)
+    margin = np.divide(profit, buy_price, out=np.zeros_like(profit), where=listed & (buy_price > 0))
+
+    n = min(top_n, int(listed.sum()))
+    if n == 0: return []
+    top = np.argpartition(-profit, n - 1)[:n]
+    top = top[np.argsort(-profit[top], kind="stable")]
+
+    return [{
+        "item": items[i],
+        "buy_market": markets[buy_idx[i]],
+        "buy_price": float(buy_price[i]),
+        "sell_market": markets[sell_idx[i]] if per_market_sell else None,
+        "sell_net": float(sell_net[i]),
+        "profit": float(profit[i]),
+        "margin": float(margin[i]),
+    } for i in top]
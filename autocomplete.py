@@ -0,0 +1,97 @@
+"""
+Debounced autocomplete pipeline: keystrokes are coalesced on the GUI thread and matched
+on a background thread, where stale queries are abandoned as soon as a newer one arrives.
+"""
+import threading
+from array import array
+from collections import OrderedDict
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+from config import AUTOCOMPLETE_DEBOUNCE_MS
+from metrics import METRICS
+
+
+class Autocomplete(QObject):
+    """
+    submit() restarts the debounce timer; when it fires, the query is handed to the worker
+    thread tagged with a generation number. Every keystroke bumps the generation, so work
+    for an older one stops early and its results are never emitted.
+
+    The full hit list of recent queries is kept: a query extending one of them (typing on)
+    only rescans that list, and a query seen before (backspacing) is answered from it.
+    """
+    results_ready = pyqtSignal(int, str, list)  # generation, query, [{'name', 'image'}]
+
+    def __init__(self, limit=25, debounce_ms=AUTOCOMPLETE_DEBOUNCE_MS, history=32, parent=None):
+        super().__init__(parent)
+        self.limit = limit
+        self.history = history
+        self.index = None
+        self.generation = 0
+        self._text = ""
+        self._pending = None            # (generation, query, index) for the worker
+        self._cond = threading.Condition()
+        self._hits = OrderedDict()      # query -> array of every matching doc id (worker thread only)
+        self._hits_index = None
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(debounce_ms)
+        self._timer.timeout.connect(self._dispatch)
+        threading.Thread(target=self._work, name="autocomplete", daemon=True).start()
+
+    def set_index(self, index):
+        self.index = index
+
+    def submit(self, text):
+        """Schedules a lookup for `text`; results arrive through results_ready."""
+        self.generation += 1
+        self._text = text
+        self._timer.start()
+
+    def cancel(self):
+        self.generation += 1
+        self._timer.stop()
+
+    def _dispatch(self):
+        if self.index is None: return
+        with self._cond:
+            self._pending = (self.generation, self._text.lower().strip(), self.index)
+            self._cond.notify()
+
+    def _work(self):
+        while True:
+            with self._cond:
+                while self._pending is None: self._cond.wait()
+                generation, query, index = self._pending
+                self._pending = None
+            try:
+                with METRICS.timer("autocomplete.match"):
+                    ids = self._match(generation, query, index)
+            except Exception as e:
+                METRICS.error("autocomplete", e); continue
+            if ids is None or generation != self.generation:
+                METRICS.incr("autocomplete.stale"); continue
+            self.results_ready.emit(generation, query, [index.entry(i) for i in ids[:self.limit]])
+
+    def _match(self, generation, query, index):
+        """Every hit for `query`, narrowed from the closest cached prefix; None if superseded."""
+        if index is not self._hits_index:
+            self._hits.clear(); self._hits_index = index
+
+        ids = self._hits.get(query)
+        METRICS.cache("autocomplete.history", ids is not None)
+        if ids is not None:
+            self._hits.move_to_end(query)
+            return ids
+
+        # Any prefix of the query matches a superset of its hits
+        base = max((q for q in self._hits if query.startswith(q)), key=len, default=None)
+        if base is not None: METRICS.incr("autocomplete.narrowed")
+        ids = array("I")
+        for n, doc_id in enumerate(index.hits(query, self._hits[base] if base is not None else None)):
+            if not n % 256 and generation != self.generation: return None
+            ids.append(doc_id)
+
+        self._hits[query] = ids
+        if len(self._hits) > self.history: self._hits.popitem(last=False)
+        return ids
@@ -0,0 +1,65 @@
+"""
+Benchmark: legacy per-market extraction vs. the single-pass extractor.
+
+Usage: python benchmarks/bench_extract.py [--repeat N]
+"""
+import argparse
+import time
+
+from fixtures import load_fixtures
+from bs4 import BeautifulSoup
+from config import TARGET_MARKETS
+from extractor import PARSER_BACKEND, extract_offers, parse_document
+
+
+def legacy_extract(content):
+    """The original fetch_prices extraction loop (html.parser, ~30 tree scans)."""
+    soup = BeautifulSoup(content, "html.parser")
+    offers = []
+    page_text = soup.get_text()
+    for market in TARGET_MARKETS:
+        if market.lower() not in page_text.lower(): continue
+        market_tag = soup.find(string=lambda t: t and market.lower() in t.lower())
+        if market_tag:
+            container = market_tag.find_parent("div") or market_tag.find_parent("tr")
+            if container:
+                price_tag = container.find_next(string=lambda t: t and "$" in t)
+                if not price_tag and container.find_parent():
+                    price_tag = container.find_parent().find_next(string=lambda t: t and "$" in t)
+                if price_tag:
+                    try:
+                        offers.append({"site": market, "price": float(price_tag.strip().replace("$", "").replace(",", ""))})
+                    except ValueError: continue
+    return offers
+
+
+def single_pass(content):
+    return extract_offers(parse_document(content))
+
+
+def best_of(fn, content, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn(content)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--repeat", type=int, default=5)
+    args = ap.parse_args()
+
+    print(f"parser backend: {PARSER_BACKEND}")
+    for name, content in load_fixtures():
+        t_old, old = best_of(legacy_extract, content, args.repeat)
+        t_new, new = best_of(single_pass, content, args.repeat)
+        t_walk, _ = best_of(extract_offers, parse_document(content), args.repeat)
+        match = "ok" if old == new else "MISMATCH"
+        print(f"{name:<30} {len(content) / 1024:8.1f} KiB  legacy {t_old * 1000:8.2f} ms  "
+              f"single-pass {t_new * 1000:8.2f} ms (walk {t_walk * 1000:6.2f} ms)  x{t_old / t_new:5.2f}  offers={len(new)} [{match}]")
+
+
+if __name__ == "__main__":
+    main()
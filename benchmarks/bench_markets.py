@@ -0,0 +1,59 @@
+"""
+Benchmark: scan latency with several price sources when one of them is slow.
+
+Serves the fixture pages plus per-market JSON endpoints locally; one market answers
+after --slow seconds. Compares the csgoskins.gg page alone against the aggregator.
+
+Usage: python benchmarks/bench_markets.py [--items N] [--slow SECONDS]
+"""
+import argparse
+import statistics
+import time
+
+from stand_in_server import StandInServer, MarketStandIn
+from config import AGGREGATOR_GRACE
+from markets import JsonMarketAdapter
+from rate_limiter import RequestScheduler
+from scraper import SkinScraper
+
+
+def scan_latencies(scraper, names):
+    samples = []
+    for name in names:
+        start = time.perf_counter()
+        result = scraper.fetch_prices(name, use_cache=False)
+        samples.append((time.perf_counter() - start, len(result.get("offers", ())), result.get("partial", False)))
+    return samples
+
+
+def report(label, samples):
+    times = sorted(s[0] for s in samples)
+    print(f"{label:<28} median {statistics.median(times) * 1000:8.1f} ms   max {times[-1] * 1000:8.1f} ms   "
+          f"offers/item {statistics.fmean(s[1] for s in samples):5.1f}   partial {sum(s[2] for s in samples)}")
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    ap.add_argument("--items", type=int, default=5)
+    ap.add_argument("--slow", type=float, default=6.0, help="latency of the slow market endpoint")
+    ap.add_argument("--timeout", type=float, default=4.0, help="per-adapter timeout")
+    args = ap.parse_args()
+
+    names = [f"Benchmark Item {i} | Fixture (Field-Tested)" for i in range(args.items)]
+    with StandInServer(latency=0.2) as html, \
+            MarketStandIn({"DMarket": 0.05, "Waxpeer": 0.1, "ShadowPay": args.slow}) as markets:
+        single = SkinScraper(base_url=html.base_url, scheduler=RequestScheduler(rate=None))
+        adapters = [JsonMarketAdapter.from_dict(d) for d in markets.adapter_config(timeout=args.timeout)]
+        multi = SkinScraper(base_url=html.base_url, scheduler=RequestScheduler(rate=None), adapters=adapters)
+        try:
+            report("csgoskins.gg page only", scan_latencies(single, names))
+            multi.aggregator.grace = None
+            report("aggregated, timeouts only", scan_latencies(multi, names))
+            multi.aggregator.grace = AGGREGATOR_GRACE
+            report(f"aggregated, {AGGREGATOR_GRACE:g}s grace", scan_latencies(multi, names))
+        finally:
+            single.close(); multi.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Microbenchmark: autocomplete latency of the linear scan vs. SearchIndex.
+
+Usage: python benchmarks/bench_search.py [--db all.json] [--repeat N]
+Without --db a ~15k-name catalog is synthesized from weapon/finish/wear combinations.
+"""
+import argparse
+import itertools
+import json
+import time
+
+import fixtures  # noqa: F401  (puts the repo root on sys.path)
+from catalog import ItemCatalog
+from item_store import process_catalog
+from search_index import SearchIndex
+
+QUERIES = ["ak", "ak redline", "awp asiimov", "karambit fade", "redline field", "sticker",
+           "m4a1-s", "glock", "st", "case", "doppler phase", "xyz not found"]
+
+
+def synthetic_catalog():
+    weapons = ["AK-47", "AWP", "M4A1-S", "M4A4", "Glock-18", "USP-S", "Desert Eagle", "P250", "MP9", "MAC-10",
+               "Karambit", "Butterfly Knife", "M9 Bayonet", "Bayonet", "FAMAS", "Galil AR", "SSG 08", "P90"]
+    finishes = ["Redline", "Asiimov", "Fade", "Doppler Phase 2", "Hyper Beast", "Neo-Noir", "Slate", "Vulcan",
+                "Printstream", "Case Hardened", "Tiger Tooth", "Bloodsport", "Fire Serpent", "Safari Mesh",
+                "Boreal Forest", "Night", "Crimson Web", "Lore", "Gamma Doppler", "Emerald", "Ruby", "Sapphire"]
+    wears = ["Factory New", "Minimal Wear", "Field-Tested", "Well-Worn", "Battle-Scarred"]
+    names = [f"{p}{w} | {f} ({c})" for p, w, f, c in itertools.product(["", "StatTrak™ "], weapons, finishes, wears)]
+    names += [f"Sticker | Team {i} | Major {2014 + i % 10}" for i in range(6000)]
+    names += [f"Operation Case {i}" for i in range(1200)]
+    return ItemCatalog((n, "") for n in names)
+
+
+def load_catalog(path):
+    with open(path, encoding="utf-8") as f:
+        return process_catalog(json.load(f))
+
+
+def linear_search(db, query):
+    words = query.lower().split()
+    matches = [name for name, _ in db if all(w in name.lower() for w in words)]
+    matches.sort(key=len)
+    return matches[:25]
+
+
+def timed(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter(); fn(); best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--db", help="path to a ByMykel all.json dump")
+    ap.add_argument("--repeat", type=int, default=20)
+    args = ap.parse_args()
+
+    db = load_catalog(args.db) if args.db else synthetic_catalog()
+    start = time.perf_counter(); index = SearchIndex(db); build = time.perf_counter() - start
+    print(f"catalog: {len(db)} items, index build {build * 1000:.0f} ms, {len(index.postings)} keys")
+
+    worst = 0.0
+    for q in QUERIES:
+        assert [x['name'] for x in index.search(q)] == linear_search(db, q), q
+        t_lin = timed(lambda: linear_search(db, q), max(1, args.repeat // 4))
+        t_idx = timed(lambda: index.search(q), args.repeat)
+        worst = max(worst, t_idx)
+        print(f"{q!r:<20} linear {t_lin * 1000:8.2f} ms   index {t_idx * 1e6:8.1f} us")
+    print(f"worst-case index latency: {worst * 1e6:.1f} us ({'PASS' if worst < 1e-3 else 'FAIL'} < 1 ms)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+"""
+Regression check: the http.connection_reuse metrics must follow the connection pool a
+request actually goes through (requests picks it with get_connection_with_tls_context).
+
+Sends a few GETs to a fresh local host through StrongSSLAdapter: the first must be
+recorded as a new connection, the keep-alive ones after it as reused.
+
+Usage: python benchmarks/check_connection_reuse.py [--requests N]
+Exits with status 1 on any mismatch.
+"""
+import argparse
+import sys
+
+import requests
+from stand_in_server import StandInServer
+from metrics import METRICS
+from scraper import StrongSSLAdapter
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--requests", type=int, default=4)
+    args = ap.parse_args()
+
+    METRICS.reset()
+    with StandInServer() as server, requests.Session() as session:
+        session.mount("http://", StrongSSLAdapter(pool_connections=1, pool_maxsize=1))
+        for i in range(args.requests):
+            session.get(f"{server.base_url}/check-item-{i}", timeout=5).content
+
+    counters = METRICS.snapshot()["counters"]
+    new, reused = counters.get("http.connection_reuse.miss", 0), counters.get("http.connection_reuse.hit", 0)
+    print(f"{args.requests} request(s): {new} new connection(s), {reused} reused")
+    return 0 if (new, reused) == (1, args.requests - 1) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
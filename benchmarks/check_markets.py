@@ -0,0 +1,59 @@
+"""
+Regression check: one hung price source must not stall a multi-source batch scan.
+
+Serves the fixture pages plus per-market JSON endpoints locally, with one market that
+never answers in time, and runs scan_many over the aggregator. Every item must still
+get its csgoskins.gg offers, the scan may take at most two adapter timeouts longer than
+scanning the page alone, and the hung market must not be sent a request per item.
+
+Usage: python benchmarks/check_markets.py [--items N] [--timeout SECONDS]
+Exits with status 1 on any failure.
+"""
+import argparse
+import sys
+import time
+
+from stand_in_server import StandInServer, MarketStandIn
+from config import TARGET_MARKETS
+from markets import JsonMarketAdapter
+from rate_limiter import RequestScheduler
+from scraper import SkinScraper
+
+HUNG = "ShadowPay"
+
+
+def timed_scan(scraper, names):
+    start = time.perf_counter()
+    try:
+        results = dict(scraper.scan_many(names, use_cache=False))
+    finally:
+        scraper.close()
+    return time.perf_counter() - start, results
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--items", type=int, default=60)
+    ap.add_argument("--timeout", type=float, default=4.0, help="per-adapter timeout")
+    args = ap.parse_args()
+
+    names = [f"Benchmark Item {i} | Fixture (Field-Tested)" for i in range(args.items)]
+    with StandInServer(latency=0.05) as html, \
+            MarketStandIn({"DMarket": 0.05, "Waxpeer": 0.1, HUNG: 600.0}) as markets:
+        baseline, _ = timed_scan(SkinScraper(base_url=html.base_url, scheduler=RequestScheduler(rate=None)), names)
+        adapters = [JsonMarketAdapter.from_dict(d) for d in markets.adapter_config(timeout=args.timeout)]
+        elapsed, results = timed_scan(SkinScraper(base_url=html.base_url, scheduler=RequestScheduler(rate=None),
+                                                  adapters=adapters), names)
+        hung_requests = markets.hits[HUNG]
+
+    html_markets = set(TARGET_MARKETS) - {"DMarket", "Waxpeer", HUNG}
+    missing = [n for n, r in results.items() if not html_markets & {o['site'] for o in r.get("offers", ())}]
+    budget = baseline + 2 * args.timeout
+    print(f"{len(results) - len(missing)}/{len(results)} items with csgoskins offers in {elapsed:.1f} s "
+          f"(page alone {baseline:.1f} s, budget {budget:.1f} s), {hung_requests} request(s) to the hung {HUNG}")
+    for name in missing[:5]: print(f"  {name}: {results[name]}")
+    failed = bool(missing) or elapsed > budget or hung_requests > args.items // 2
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
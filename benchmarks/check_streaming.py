@@ -0,0 +1,54 @@
+"""
+Regression check: the streaming extractor must agree with extract_offers however the
+page is split into chunks (HTMLParser hands text nodes over in pieces at chunk edges).
+
+Usage: python benchmarks/check_streaming.py [--synthetic N]
+Exits with status 1 on any mismatch.
+"""
+import argparse
+import random
+import sys
+
+from fixtures import load_fixtures, synthetic_page
+from extractor import extract_offers, iter_offers, parse_document
+
+CHUNK_SIZES = (1, 7, 64, 1000, 16 * 1024)
+
+
+def chunked(content, size):
+    return [content[i:i + size] for i in range(0, len(content), size)]
+
+
+def random_chunks(content, rng, max_size=32):
+    chunks, i = [], 0
+    while i < len(content):
+        n = rng.randint(1, max_size)
+        chunks.append(content[i:i + n]); i += n
+    return chunks
+
+
+def key(offers):
+    return sorted((o['site'], o['price']) for o in offers)
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--synthetic", type=int, default=20, help="extra synthetic pages (random seeds)")
+    args = ap.parse_args()
+
+    pages = load_fixtures() + [(f"synthetic-{s}", synthetic_page(seed=s, padding=50)) for s in range(args.synthetic)]
+    rng = random.Random(0)
+    failures = 0
+    for name, content in pages:
+        expected = key(extract_offers(parse_document(content)))
+        splits = {f"{size}B": chunked(content, size) for size in CHUNK_SIZES}
+        splits["random"] = random_chunks(content, rng)
+        bad = [label for label, chunks in splits.items() if key(iter_offers(chunks)) != expected]
+        failures += bool(bad)
+        print(f"{name:<30} offers={len(expected):<3} {'MISMATCH at ' + ', '.join(bad) if bad else 'ok'}")
+    print(f"{len(pages) - failures}/{len(pages)} pages match")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
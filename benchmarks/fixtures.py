@@ -0,0 +1,50 @@
+"""
+Saved csgoskins.gg HTML pages used by the offline benchmarks.
+
+Record item pages into benchmarks/fixtures/<slug>.html with record_fixtures.py. No recorded pages
+ship with the repository, so until some are recorded the benchmarks run on a synthetic
+page instead: an invented layout (one offer row per market, padded with navigation,
+listings and inline scripts) that only approximates the real site. Timings and offer
+counts measured on it are not comparable with runs on recorded pages.
+"""
+import os
+import random
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path: sys.path.insert(0, ROOT)
+
+from config import TARGET_MARKETS
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+
+def synthetic_page(seed=0, padding=1500):
+    """Builds a large item page resembling the csgoskins.gg offer table."""
+    rng = random.Random(seed)
+    parts = ["<html><head><title>AK-47 | Redline (Field-Tested)</title>"]
+    parts.append("<script>window.__DATA__ = {\"currency\": \"USD\", \"items\": []};</script></head><body>")
+    parts.append("<nav>" + "".join(f"<div class='nav'><a href='/c/{i}'>Category {i}</a></div>" for i in range(120)) + "</nav>")
+    for i in range(padding):
+        parts.append(f"<div class='row'><span>Related item {i}</span><div><p>Listed {rng.randint(1, 99)} times</p></div></div>")
+    parts.append("<table class='offers'>")
+    for market in rng.sample(TARGET_MARKETS, len(TARGET_MARKETS)):
+        price = rng.uniform(5, 500)
+        parts.append(f"<tr><td><div class='market'><img src='/m.png'/><span>{market}</span></div></td>"
+                     f"<td><div class='price'>${price:,.2f}</div></td></tr>")
+    parts.append("</table>")
+    for i in range(padding // 3):
+        parts.append(f"<div class='footer'><span>Footer link {i}</span></div>")
+    parts.append("</body></html>")
+    return "".join(parts).encode("utf-8")
+
+
+def load_fixtures():
+    """Returns a list of (name, raw_bytes) pages from disk, or [("synthetic", page)] when none are recorded."""
+    pages = []
+    if os.path.isdir(FIXTURE_DIR):
+        for fname in sorted(os.listdir(FIXTURE_DIR)):
+            if fname.endswith(".html"):
+                with open(os.path.join(FIXTURE_DIR, fname), "rb") as f:
+                    pages.append((fname[:-5], f.read()))
+    return pages or [("synthetic", synthetic_page())]
@@ -0,0 +1,29 @@
+"""
+Records live csgoskins.gg item pages into benchmarks/fixtures/<slug>.html.
+
+Usage: python benchmarks/record_fixtures.py "AK-47 | Redline (Field-Tested)" "AWP | Asiimov" ...
+"""
+import os
+import sys
+
+from fixtures import FIXTURE_DIR
+from scraper import SkinScraper
+
+
+def main(names):
+    scraper = SkinScraper()
+    os.makedirs(FIXTURE_DIR, exist_ok=True)
+    for name in names:
+        name_slug, _ = scraper.parse_input(name)
+        response = scraper.scraper.get(scraper.item_url(name), timeout=20)
+        if response.status_code != 200:
+            print(f"{name}: HTTP {response.status_code}, skipped"); continue
+        path = os.path.join(FIXTURE_DIR, f"{name_slug}.html")
+        with open(path, "wb") as f:
+            f.write(response.content)
+        print(f"{name}: {len(response.content) / 1024:.0f} KiB -> {path}")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2: sys.exit(__doc__.strip())
+    main(sys.argv[1:])
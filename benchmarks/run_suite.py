@@ -0,0 +1,123 @@
+"""
+Offline benchmark suite for the scraping pipeline.
+
+Serves the fixture pages from a local stand-in server and reports per-stage timings
+(parse_input, network fetch, BeautifulSoup parse, market extraction) plus batch
+throughput. Results are written as JSON and can be compared against a baseline.
+
+    python benchmarks/run_suite.py --save benchmarks/baseline.json
+    python benchmarks/run_suite.py --compare benchmarks/baseline.json
+"""
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+
+from stand_in_server import StandInServer
+from extractor import PARSER_BACKEND, extract_offers, parse_document
+from rate_limiter import RequestScheduler
+from scraper import SkinScraper
+
+SAMPLE_NAMES = ["AK-47 | Redline (Field-Tested)", "StatTrak™ AWP | Asiimov (Battle-Scarred)",
+                "★ Karambit | Doppler (Factory New)", "Souvenir M4A1-S | Knight (Minimal Wear)",
+                "Sticker | Crown (Foil)", "Operation Breakout Weapon Case"]
+
+
+def summarize(samples):
+    """Milliseconds: median, p95 and mean of a list of second-valued samples."""
+    ordered = sorted(samples)
+    p95 = ordered[min(len(ordered) - 1, int(round(0.95 * (len(ordered) - 1))))]
+    return {"median_ms": statistics.median(ordered) * 1000, "p95_ms": p95 * 1000,
+            "mean_ms": statistics.fmean(ordered) * 1000, "n": len(ordered)}
+
+
+def stage_timings(scraper, repeat):
+    stages = {"parse_input": [], "fetch": [], "soup_parse": [], "extract": [], "total": []}
+    for _ in range(repeat):
+        for name in SAMPLE_NAMES:
+            t0 = time.perf_counter()
+            url = scraper.item_url(name)
+            t1 = time.perf_counter()
+            content = scraper.scraper.get(url, timeout=20).content
+            t2 = time.perf_counter()
+            soup = parse_document(content)
+            t3 = time.perf_counter()
+            extract_offers(soup)
+            t4 = time.perf_counter()
+            for key, dt in zip(stages, (t1 - t0, t2 - t1, t3 - t2, t4 - t3, t4 - t0)):
+                stages[key].append(dt)
+    return {key: summarize(samples) for key, samples in stages.items()}
+
+
+def batch_throughput(scraper, items, workers):
+    names = [f"Benchmark Item {i} | Fixture (Field-Tested)" for i in range(items)]
+    start = time.perf_counter()
+    ok = sum(1 for _, res in scraper.scan_many(names, workers) if "offers" in res)
+    elapsed = time.perf_counter() - start
+    return {"items": items, "workers": workers, "ok": ok, "seconds": elapsed, "items_per_s": items / elapsed}
+
+
+def compare(current, baseline, tolerance):
+    """Prints relative changes of every median / throughput figure; returns True on regression."""
+    regressed = False
+    for stage, cur in current["stages"].items():
+        base = baseline.get("stages", {}).get(stage)
+        if not base: continue
+        change = cur["median_ms"] / base["median_ms"] - 1 if base["median_ms"] else 0.0
+        flag = "REGRESSION" if change > tolerance else ""
+        regressed |= bool(flag)
+        print(f"  {stage:<12} {base['median_ms']:9.3f} -> {cur['median_ms']:9.3f} ms  {change:+7.1%} {flag}")
+    for key, cur in current["batch"].items():
+        base = baseline.get("batch", {}).get(key)
+        if not base: continue
+        change = cur["items_per_s"] / base["items_per_s"] - 1
+        flag = "REGRESSION" if change < -tolerance else ""
+        regressed |= bool(flag)
+        print(f"  batch {key:<6} {base['items_per_s']:9.1f} -> {cur['items_per_s']:9.1f} items/s  {change:+7.1%} {flag}")
+    return regressed
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Offline benchmark suite for the scraping pipeline.")
+    ap.add_argument("--repeat", type=int, default=5, help="passes over the sample items for stage timings")
+    ap.add_argument("--latency", type=float, default=0.05, help="simulated server latency in seconds")
+    ap.add_argument("--items", type=int, default=60, help="items per batch throughput run")
+    ap.add_argument("--workers", type=int, nargs="+", default=[1, 8], help="batch concurrency levels")
+    ap.add_argument("--save", help="write the results JSON here")
+    ap.add_argument("--compare", help="baseline JSON to compare against")
+    ap.add_argument("--tolerance", type=float, default=0.15, help="allowed slowdown before flagging (fraction)")
+    args = ap.parse_args(argv)
+
+    with StandInServer(latency=args.latency) as server:
+        # Pacing is disabled so the suite measures the pipeline, not the token bucket
+        scraper = SkinScraper(pool_size=max(args.workers), base_url=server.base_url,
+                              scheduler=RequestScheduler(rate=None, max_concurrency=max(args.workers)))
+        results = {
+            "meta": {"python": platform.python_version(), "machine": platform.machine(),
+                     "parser": PARSER_BACKEND, "fixtures": sorted(server.pages), "latency_s": args.latency,
+                     "timestamp": time.time()},
+            "stages": stage_timings(scraper, args.repeat),
+            "batch": {f"w{w}": batch_throughput(scraper, args.items, w) for w in args.workers},
+        }
+
+    print(f"parser={PARSER_BACKEND} fixtures={len(results['meta']['fixtures'])} latency={args.latency * 1000:.0f} ms")
+    if results["meta"]["fixtures"] == ["synthetic"]:
+        print("  no recorded pages in benchmarks/fixtures: measured on the synthetic page (see fixtures.py)")
+    for stage, s in results["stages"].items():
+        print(f"  {stage:<12} median {s['median_ms']:9.3f} ms   p95 {s['p95_ms']:9.3f} ms")
+    for key, b in results["batch"].items():
+        print(f"  batch {key:<6} {b['items_per_s']:8.1f} items/s  ({b['ok']}/{b['items']} ok in {b['seconds']:.2f} s)")
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f: json.dump(results, f, indent=2)
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f: baseline = json.load(f)
+        print(f"vs {args.compare}:")
+        if compare(results, baseline, args.tolerance): return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
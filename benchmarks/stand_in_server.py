@@ -0,0 +1,112 @@
+"""
+Local stand-in for csgoskins.gg: serves the recorded fixture pages over HTTP.
+
+Any /items/<slug>[/<condition>] path returns the fixture recorded for that slug, or
+one of the others (chosen by a hash of the path) so arbitrary watchlists work.
+MarketStandIn serves per-market JSON quotes for the market adapters the same way.
+"""
+import http.server
+import json
+import threading
+import time
+import zlib
+
+from fixtures import load_fixtures
+
+
+class StandInServer:
+    """Threaded HTTP server on 127.0.0.1 with optional per-request latency."""
+    content_type = "text/html; charset=utf-8"
+
+    def __init__(self, pages=None, latency=0.0, port=0):
+        self.pages = dict(pages or load_fixtures())
+        self.latency = latency
+        self.requests = 0
+        server = self
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                server.requests += 1
+                if server.latency: time.sleep(server.latency)
+                body = server.page_for(self.path)
+                if body is None:
+                    self.send_response(404); self.send_header("Content-Length", "0"); self.end_headers(); return
+                self.send_response(200)
+                self.send_header("Content-Type", server.content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args): pass
+
+        self.httpd = http.server.ThreadingHTTPServer(("127.0.0.1", port), Handler)
+        self.httpd.daemon_threads = True
+        self.thread = None
+
+    @property
+    def base_url(self):
+        return f"http://127.0.0.1:{self.httpd.server_port}/items"
+
+    def page_for(self, path):
+        parts = [p for p in path.split("?")[0].split("/") if p]
+        if len(parts) < 2 or parts[0] != "items" or not self.pages: return None
+        if parts[1] in self.pages: return self.pages[parts[1]]
+        names = sorted(self.pages)
+        return self.pages[names[zlib.crc32(path.encode()) % len(names)]]
+
+    def __enter__(self):
+        self.thread = threading.Thread(target=self.httpd.serve_forever, name="stand-in", daemon=True)
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.httpd.shutdown(); self.httpd.server_close()
+
+
+class MarketStandIn(StandInServer):
+    """
+    JSON price endpoints at /<market>/<slug>[/<condition>], one per market with its own
+    latency: {"listings": [{"price": ..., "updated_at": ...}]} with a price derived from the path.
+    """
+    content_type = "application/json"
+
+    def __init__(self, latencies, port=0):
+        super().__init__(pages={}, port=port)
+        self.latencies = dict(latencies)  # market -> seconds
+        self.hits = dict.fromkeys(self.latencies, 0)  # market -> requests received
+        self.httpd.handle_error = lambda request, address: None  # Clients hang up on markets that timed out
+
+    @property
+    def base_url(self):
+        return f"http://127.0.0.1:{self.httpd.server_port}"
+
+    def endpoint(self, market):
+        """URL template for JsonMarketAdapter."""
+        return f"{self.base_url}/{market}/{{slug}}/{{condition}}"
+
+    def adapter_config(self, **extra):
+        return [dict(market=m, url=self.endpoint(m), listings="listings", ts="updated_at", **extra)
+                for m in self.latencies]
+
+    def page_for(self, path):
+        parts = [p for p in path.split("?")[0].split("/") if p]
+        if len(parts) < 2 or parts[0] not in self.latencies: return None
+        self.hits[parts[0]] += 1
+        time.sleep(self.latencies[parts[0]])
+        price = 1 + zlib.crc32(path.encode()) % 50000 / 100
+        return json.dumps({"listings": [{"price": price, "updated_at": time.time()},
+                                        {"price": price + 1.5, "updated_at": time.time()}]}).encode()
+
+
+if __name__ == "__main__":
+    import argparse
+    ap = argparse.ArgumentParser(description="Serve the fixture pages as a local csgoskins.gg stand-in.")
+    ap.add_argument("--port", type=int, default=8765)
+    ap.add_argument("--latency", type=float, default=0.0, help="seconds added to every response")
+    args = ap.parse_args()
+    with StandInServer(latency=args.latency, port=args.port) as srv:
+        print(f"serving {len(srv.pages)} page(s) at {srv.base_url}  (Ctrl+C to stop)")
+        try: srv.thread.join()
+        except KeyboardInterrupt: pass
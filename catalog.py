@@ -0,0 +1,185 @@
+"""
+Compact, picklable item catalog (name -> image URL) replacing the list of per-item dicts.
+"""
+import re
+import zlib
+from array import array
+
+# Wear conditions by their lowercase name and their usual abbreviation ("(FT)")
+_WEARS = {w.lower(): w for w in ("Factory New", "Minimal Wear", "Field-Tested", "Well-Worn", "Battle-Scarred")}
+_WEARS.update({"fn": "Factory New", "mw": "Minimal Wear", "ft": "Field-Tested", "ww": "Well-Worn", "bs": "Battle-Scarred"})
+_WEAR_PATTERN = "|".join(_WEARS)
+_VARIANT_RE = re.compile(rf"stattrak(?:™)?|souvenir|\((?:{_WEAR_PATTERN})\)", re.IGNORECASE)
+_WEAR_RE = re.compile(rf"\(({_WEAR_PATTERN})\)", re.IGNORECASE)
+
+
+def normalize_name(name):
+    """Lookup key for exact-name matches: no star, lowercase, single spaces."""
+    return " ".join(name.replace("★", "").lower().split())
+
+
+def base_name(name):
+    """Lookup key shared by every variant of a skin: normalize_name without wear, StatTrak or Souvenir."""
+    return normalize_name(_VARIANT_RE.sub(" ", name))
+
+
+def _variant_slugs(raw_name, base_slug):
+    """Applies the StatTrak/Souvenir prefixes and wear condition written in `raw_name` to a base slug."""
+    lowered = raw_name.lower()
+    if "stattrak" in lowered: base_slug = f"stattrak-{base_slug}"
+    if "souvenir" in lowered: base_slug = f"souvenir-{base_slug}"
+    wear = _WEAR_RE.search(raw_name)
+    return base_slug, _WEARS[wear.group(1).lower()].lower().replace(" ", "-") if wear else ""
+
+
+def _variant_name(raw_name, base):
+    """Market hash name of the StatTrak/Souvenir variant and wear written in `raw_name` of catalog name `base`."""
+    lowered = raw_name.lower()
+    name = " ".join(_VARIANT_RE.sub(" ", base).split())
+    if "souvenir" in lowered: name = f"Souvenir {name}"
+    if "stattrak" in lowered: name = f"StatTrak™ {name}"
+    wear = _WEAR_RE.search(raw_name)
+    return f"{name} ({_WEARS[wear.group(1).lower()]})" if wear else name
+
+
+def slugify(raw_name):
+    """csgoskins.gg (name_slug, condition_slug) for an item name, derived from its text alone."""
+    base = _VARIANT_RE.sub(" ", raw_name).replace("★", "").replace("|", "")
+    return _variant_slugs(raw_name, "-".join(base.lower().split()))
+
+
+def _name_hash(key):
+    return zlib.crc32(key.encode("utf-8"))
+
+
+class _KeyTable:
+    """Open-addressing hash table from key(name) to the first catalog id (in `ids` order) carrying it."""
+    def __init__(self, catalog, key, ids):
+        self.key = key
+        size = 1
+        while size < 2 * len(catalog) + 1: size <<= 1
+        self.mask = size - 1
+        self.slots = array("i", [-1]) * size
+        self.hashes = array("I", [0]) * len(catalog)
+        keys = {}
+        for i in ids:
+            k = keys[i] = key(catalog.name(i))
+            h = self.hashes[i] = _name_hash(k)
+            slot = h & self.mask
+            while self.slots[slot] != -1:
+                other = self.slots[slot]
+                if self.hashes[other] == h and keys[other] == k: break  # Keep the first id for duplicate keys
+                slot = (slot + 1) & self.mask
+            else:
+                self.slots[slot] = i
+
+    def find(self, catalog, name):
+        k = self.key(name)
+        h = _name_hash(k)
+        slot = h & self.mask
+        while True:
+            i = self.slots[slot]
+            if i == -1: return -1
+            if self.hashes[i] == h and self.key(catalog.name(i)) == k: return i
+            slot = (slot + 1) & self.mask
+
+
+class ItemCatalog:
+    """
+    All names live in one string with an offset array; image URLs are split into a
+    shared prefix (deduplicated, referenced by id) and a suffix stored the same way.
+    The csgoskins.gg slug of every entry's base skin is precomputed into a third buffer.
+    Exact and base-name lookups go through open-addressing hash tables of int arrays,
+    so the whole catalog is a handful of flat buffers that pickle (and unpickle) quickly.
+    """
+    def __init__(self, pairs=()):
+        names, suffixes = [], []
+        prefixes, prefix_index = [], {}
+        self._prefix_ids = array("H")
+        for name, image in pairs:
+            cut = image.rfind("/") + 1
+            prefix = image[:cut]
+            pid = prefix_index.get(prefix)
+            if pid is None:
+                pid = prefix_index[prefix] = len(prefixes)
+                prefixes.append(prefix)
+            names.append(name); suffixes.append(image[cut:])
+            self._prefix_ids.append(pid)
+
+        self._names, self._name_offsets = self._pack(names)
+        self._suffixes, self._suffix_offsets = self._pack(suffixes)
+        self._slugs, self._slug_offsets = self._pack([slugify(base_name(n))[0] for n in names])
+        self._prefixes = prefixes
+        self._build_table()
+
+    @staticmethod
+    def _pack(strings):
+        offsets = array("I", [0])
+        total = 0
+        for s in strings:
+            total += len(s); offsets.append(total)
+        return "".join(strings), offsets
+
+    def _build_table(self):
+        ids = range(len(self))
+        self._exact = _KeyTable(self, normalize_name, ids)
+        # Shortest name first, so a base key resolves to the plain skin rather than one of its variants
+        self._base = _KeyTable(self, base_name, sorted(ids, key=lambda i: len(self.name(i))))
+
+    # --- Access ---
+    def __len__(self):
+        return len(self._prefix_ids)
+
+    def __iter__(self):
+        for i in range(len(self)): yield self.name(i), self.image(i)
+
+    def __eq__(self, other):
+        return (isinstance(other, ItemCatalog) and self._names == other._names
+                and self._name_offsets == other._name_offsets and self._suffixes == other._suffixes
+                and self._prefix_ids == other._prefix_ids and self._prefixes == other._prefixes)
+
+    def name(self, i):
+        return self._names[self._name_offsets[i]:self._name_offsets[i + 1]]
+
+    def image(self, i):
+        return self._prefixes[self._prefix_ids[i]] + self._suffixes[self._suffix_offsets[i]:self._suffix_offsets[i + 1]]
+
+    def slug(self, i):
+        """csgoskins.gg name slug of entry i's base skin (no StatTrak/Souvenir prefix, no wear)."""
+        return self._slugs[self._slug_offsets[i]:self._slug_offsets[i + 1]]
+
+    def entry(self, i):
+        """The {'name', 'image'} dict shape the UI works with."""
+        return {'name': self.name(i), 'image': self.image(i)}
+
+    def find(self, name):
+        """Index of the entry whose normalized name equals `name`'s, or -1. O(1) expected."""
+        return self._exact.find(self, name)
+
+    def find_base(self, name):
+        """Index of the canonical entry for any variant of `name` (wear/StatTrak/Souvenir ignored), or -1."""
+        i = self._exact.find(self, name)
+        return i if i >= 0 else self._base.find(self, name)
+
+    def resolve_slugs(self, raw_name):
+        """(name_slug, condition_slug) for any variant of a catalog item, or None if it is not in the catalog."""
+        i = self.find_base(raw_name)
+        return _variant_slugs(raw_name, self.slug(i)) if i >= 0 else None
+
+    def canonical_name(self, raw_name):
+        """
+        Catalog spelling of any variant of a catalog item, e.g. "StatTrak™ AK-47 | Redline (Field-Tested)"
+        for "stattrak ak-47 | redline (field-tested)"; None if it is not in the catalog.
+        """
+        i = self.find(raw_name)
+        if i >= 0: return self.name(i)
+        i = self._base.find(self, raw_name)
+        return _variant_name(raw_name, self.name(i)) if i >= 0 else None
+
+    def get(self, name):
+        i = self.find(name)
+        return self.entry(i) if i >= 0 else None
+
+    def get_base(self, name):
+        i = self.find_base(name)
+        return self.entry(i) if i >= 0 else None
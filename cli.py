@@ -0,0 +1,118 @@
+"""
+Headless command-line scanner (no PyQt). Reads item names from a file or stdin,
+scans them concurrently and writes JSON Lines or CSV.
+
+    python cli.py -i watchlist.txt --sell-price 12.5 --fee 2 -o scan.jsonl
+    cat watchlist.txt | python cli.py --format csv > scan.csv
+    python cli.py -i watchlist.txt --snapshot scan.parquet -o /dev/null
+"""
+import argparse
+import csv
+import json
+import sys
+import time
+
+from config import SCAN_CONCURRENCY, PRICE_HISTORY_PATH, MARKET_ADAPTERS_PATH
+from item_store import ItemStore
+from markets import load_adapters
+from price_history import PriceHistory
+from scraper import SkinScraper, read_watchlist
+
+CSV_FIELDS = ["item", "site", "price", "best_site", "best_price", "net_income", "net_profit", "error", "scanned_at"]
+
+
+def summarize(item, result, sell_price=0.0, fee=0.0):
+    """Flattens one fetch_prices result into a record with the best offer and its net profit."""
+    record = {"item": item, "scanned_at": round(time.time(), 3)}
+    if "error" in result:
+        record["error"] = result["error"]
+        return record
+
+    offers = sorted(result["offers"], key=lambda x: x['price'])
+    net_income = sell_price * (1 - (fee / 100))
+    record.update(offers=offers, best_site=offers[0]['site'], best_price=offers[0]['price'])
+    if result.get("partial"): record["sources"] = result["sources"]  # Which market sources failed or timed out
+    if net_income > 0:
+        record.update(net_income=round(net_income, 4), net_profit=round(net_income - offers[0]['price'], 4))
+    return record
+
+
+def write_jsonl(records, out):
+    for record in records:
+        out.write(json.dumps(record, ensure_ascii=False) + "\n")
+        out.flush()
+
+
+def write_csv(records, out):
+    writer = csv.DictWriter(out, fieldnames=CSV_FIELDS, extrasaction="ignore")
+    writer.writeheader()
+    for record in records:
+        base = {k: v for k, v in record.items() if k != "offers"}
+        if "error" in record:
+            writer.writerow(base)
+        for offer in record.get("offers", []):
+            row = dict(base, site=offer['site'], price=offer['price'])
+            if "net_income" in record: row["net_profit"] = round(record["net_income"] - offer['price'], 4)
+            writer.writerow(row)
+        out.flush()
+
+
+def tee_snapshot(results, snapshot, net_income=0.0):
+    """Passes scan results through while appending their offers to a SnapshotWriter."""
+    for name, result in results:
+        snapshot.write(name, result, net_income)
+        yield name, result
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Scan CS2 item prices without the GUI.")
+    ap.add_argument("-i", "--input", help="watchlist file, one item per line (default: stdin)")
+    ap.add_argument("-o", "--output", help="output file (default: stdout)")
+    ap.add_argument("-f", "--format", choices=("jsonl", "csv"), default="jsonl")
+    ap.add_argument("--sell-price", type=float, default=0.0, help="your selling price in $")
+    ap.add_argument("--fee", type=float, default=0.0, help="selling fee in %%")
+    ap.add_argument("-w", "--workers", type=int, default=SCAN_CONCURRENCY, help="concurrent fetches")
+    ap.add_argument("--history", default=PRICE_HISTORY_PATH, help="price history database (default: %(default)s)")
+    ap.add_argument("--no-history", action="store_true", help="do not record this scan")
+    ap.add_argument("--snapshot", metavar="PATH",
+                    help="also stream every offer to a columnar snapshot (.parquet/.arrow need pyarrow, or .npz/.csv)")
+    ap.add_argument("--markets", default=MARKET_ADAPTERS_PATH,
+                    help="JSON list of extra per-market price endpoints, queried alongside csgoskins.gg (default: %(default)s)")
+    ap.add_argument("--no-catalog", action="store_true",
+                    help="guess URLs from the names instead of resolving them against the GUI's item catalog")
+    args = ap.parse_args(argv)
+
+    if args.input:
+        with open(args.input, encoding="utf-8") as f: names = read_watchlist(f)
+    else:
+        names = read_watchlist(sys.stdin)
+    if not names:
+        ap.error("no item names given")
+
+    history = None if args.no_history else PriceHistory(args.history)
+    catalog = None if args.no_catalog else ItemStore().load()
+    scraper = SkinScraper(pool_size=args.workers, history=history, catalog=catalog, adapters=load_adapters(args.markets))
+    results = scraper.scan_many(names, args.workers)
+    snapshot = None
+    if args.snapshot:
+        from snapshots import SnapshotWriter  # numpy (and pyarrow) only when snapshotting
+        try: snapshot = SnapshotWriter(args.snapshot)
+        except ValueError as e: ap.error(str(e))
+        net_income = args.sell_price * (1 - (args.fee / 100))
+        results = tee_snapshot(results, snapshot, net_income)
+    records = (summarize(name, res, args.sell_price, args.fee) for name, res in results)
+    write = write_csv if args.format == "csv" else write_jsonl
+
+    out = open(args.output, "w", encoding="utf-8", newline="") if args.output else sys.stdout
+    try:
+        write(records, out)
+    finally:
+        if out is not sys.stdout: out.close()
+        if history is not None: history.close()
+        if snapshot is not None: snapshot.close()
+        scraper.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,6 +1,34 @@
 """
 Configuration and styling constants for the CS2 Market Arbitrage Tool.
 """
+import os
+
+# Local data (item catalog, caches) lives in the user's home so it survives updates
+DATA_DIR = os.path.join(os.path.expanduser("~"), ".cs2-trade-terminal")
+CATALOG_URL = "https://raw.githubusercontent.com/ByMykel/CSGO-API/main/public/api/en/all.json"
+ITEM_DB_PATH = os.path.join(DATA_DIR, "items.sqlite3")
+PRICE_HISTORY_PATH = os.path.join(DATA_DIR, "price_history.sqlite3")
+
+# Parsed scan results are reused for OFFER_CACHE_TTL seconds; up to OFFER_CACHE_STALE_TTL they
+# are still shown instantly while a background refresh runs
+OFFER_CACHE_PATH = os.path.join(DATA_DIR, "offer_cache.json")
+OFFER_CACHE_TTL = 300
+OFFER_CACHE_STALE_TTL = 3600
+OFFER_CACHE_SIZE = 512
+OFFER_CACHE_SAVE_DELAY = 5.0  # Seconds between an update and the next write of the cache file
+
+# Image cache: raw bytes in a memory LRU backed by a content-addressed disk store,
+# plus already-decoded thumbnails kept in their own budget
+IMAGE_CACHE_DIR = os.path.join(DATA_DIR, "images")
+IMAGE_MEMORY_BUDGET = 64 * 1024 * 1024
+THUMBNAIL_MEMORY_BUDGET = 32 * 1024 * 1024
+ICON_FETCH_WORKERS = 4          # Parallel thumbnail downloads for the autocomplete list
+AUTOCOMPLETE_DEBOUNCE_MS = 120  # Quiet time after the last keystroke before suggestions are matched
+
+# Asyncio network core (catalog and images); aiohttp is used when installed
+NET_MAX_CONNECTIONS = 64
+NET_MAX_CONNECTIONS_PER_HOST = 8
+NET_FALLBACK_WORKERS = 8        # Executor threads for blocking work (and requests when aiohttp is missing)
 
 TARGET_MARKETS = [
     "CS.MONEY", "WOW Skins", "UUSKINS", "SkinSwap", "Buff163", 
@@ -8,6 +36,49 @@ TARGET_MARKETS = [
     "Tradeit.gg", "Exeskins", "Skinvault", "ShadowPay", "Market.CSGO"
 ]
 
+# Seller fee (%) charged by each market when relisting there; markets not listed count as 0
+MARKET_FEES = {
+    "CS.MONEY": 5.0, "DMarket": 2.0, "Buff163": 2.5, "Waxpeer": 6.0, "ShadowPay": 5.0,
+    "Market.CSGO": 5.0, "LIS-SKINS": 5.0, "Skinvault": 4.0, "Avan.market": 5.0,
+}
+
+# Show single-item offers as they are parsed from the still-downloading page
+STREAM_RESULTS = True
+
+# Batch (watchlist) scanning
+SCAN_CONCURRENCY = 8            # Items fetched in parallel by a batch scan
+MAX_CONNECTIONS_PER_HOST = 8    # Pooled keep-alive connections per host (blocks when exhausted)
+SLUG_CACHE_SIZE = 4096          # Memoized name -> URL slug resolutions
+PARSE_PROCESSES = max(1, min(8, (os.cpu_count() or 2) - 1))  # Batch-scan parser processes (1 parses in-thread)
+PARSE_TIMEOUT = 30.0            # Seconds a parser process may take before the page is parsed in-thread
+# Extra price sources (see markets.py): each call gets its source's timeout as one total deadline
+# (no retries), counted from when it starts, and is abandoned at it or GRACE seconds after the
+# first source answered. The csgoskins.gg page carries most markets and is exempt from the grace
+# period. Every source runs on its own few threads, and one that keeps timing out is skipped for
+# a while, so a blocked site cannot hold up the others
+MARKET_ADAPTERS_PATH = os.path.join(DATA_DIR, "markets.json")  # Optional per-market JSON endpoints
+HTML_ADAPTER_TIMEOUT = 20.0
+ADAPTER_TIMEOUT = 8.0
+AGGREGATOR_GRACE = 2.0
+ADAPTER_MAX_IN_FLIGHT = SCAN_CONCURRENCY  # Calls per source running at once; further ones queue
+ADAPTER_BREAKER_TIMEOUTS = 3    # Timeouts in a row after which a source is skipped...
+ADAPTER_BREAKER_COOLDOWN = 30.0  # ...for this many seconds, then tried again with a single call
+SNAPSHOT_CHUNK_ROWS = 16384     # Rows buffered per chunk (row group / record batch) when writing snapshots
+
+# Background monitoring: items are re-polled every MIN..MAX seconds, sooner the closer they are
+# to an alert (within NEAR_GAP, i.e. a 10% price drop, an item is polled at the fastest rate)
+MONITOR_MIN_INTERVAL = 60.0
+MONITOR_MAX_INTERVAL = 900.0
+MONITOR_NEAR_GAP = 0.10
+ALERT_WEBHOOK_URL = os.environ.get("CS2_ALERT_WEBHOOK")  # e.g. http://127.0.0.1:8080/alerts; JSON POST per alert
+
+# Request pacing per host: token bucket, then retries on 429/5xx with full-jitter exponential backoff
+REQUESTS_PER_SECOND = 2.0
+REQUEST_BURST = 4
+MAX_RETRIES = 3
+BACKOFF_BASE = 1.0              # Seconds; attempt n waits up to BACKOFF_BASE * 2**n
+BACKOFF_MAX = 60.0              # Also caps how long a Retry-After header is honored
+
 GLOBAL_STYLE = """
     QMainWindow { background-color: #121212; }
     QWidget { font-family: 'Segoe UI', Roboto, sans-serif; color: #E0E0E0; }
@@ -0,0 +1,83 @@
+"""
+Diagnostics window: live view of the instrumentation counters, timers and errors.
+"""
+from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QTableWidget,
+                             QTableWidgetItem, QHeaderView, QFileDialog, QAbstractItemView)
+from PyQt5.QtCore import Qt, QTimer
+
+from metrics import METRICS
+
+TIMER_COLUMNS = ["TIMER", "COUNT", "MEAN ms", "P50 ms", "P95 ms", "MAX ms"]
+
+
+class DiagnosticsDialog(QDialog):
+    """Shows METRICS as tables, refreshed every second while open, with JSON export."""
+    def __init__(self, parent=None, metrics=METRICS):
+        super().__init__(parent)
+        self.metrics = metrics
+        self.setWindowTitle("Diagnostics")
+        self.resize(900, 640)
+
+        layout = QVBoxLayout(self)
+        self.lbl_summary = QLabel()
+        self.lbl_summary.setStyleSheet("color: #9E9E9E; font-size: 12px;")
+        layout.addWidget(self.lbl_summary)
+
+        self.tbl_timers = self._make_table(TIMER_COLUMNS)
+        layout.addWidget(self.tbl_timers, 3)
+
+        stats_row = QHBoxLayout()
+        self.tbl_rates = self._make_table(["CACHE", "HIT RATE"])
+        self.tbl_counters = self._make_table(["COUNTER", "VALUE"])
+        stats_row.addWidget(self.tbl_rates); stats_row.addWidget(self.tbl_counters)
+        layout.addLayout(stats_row, 2)
+
+        self.tbl_errors = self._make_table(["SOURCE", "ERROR"])
+        layout.addWidget(self.tbl_errors, 1)
+
+        buttons = QHBoxLayout()
+        btn_reset = QPushButton("Reset"); btn_reset.clicked.connect(self.on_reset)
+        btn_export = QPushButton("Export JSON"); btn_export.clicked.connect(self.on_export)
+        buttons.addStretch(); buttons.addWidget(btn_reset); buttons.addWidget(btn_export)
+        layout.addLayout(buttons)
+
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.refresh)
+        self.timer.start(1000)
+        self.refresh()
+
+    @staticmethod
+    def _make_table(columns):
+        table = QTableWidget(0, len(columns))
+        table.setHorizontalHeaderLabels(columns)
+        table.verticalHeader().hide()
+        table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeToContents)
+        return table
+
+    @staticmethod
+    def _fill(table, rows):
+        table.setRowCount(len(rows))
+        for r, values in enumerate(rows):
+            for c, value in enumerate(values):
+                item = QTableWidgetItem(str(value))
+                if c: item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+                table.setItem(r, c, item)
+
+    def refresh(self):
+        snap = self.metrics.snapshot()
+        self.lbl_summary.setText(f"Uptime {snap['uptime_s']:.0f} s  ·  {len(snap['timers'])} timers  ·  "
+                                 f"{len(snap['recent_errors'])} recent errors  ·  press F12 to toggle")
+        self._fill(self.tbl_timers, [(name, t['count'], f"{t['mean_ms']:.2f}", f"{t['p50_ms']:.1f}",
+                                      f"{t['p95_ms']:.1f}", f"{t['max_ms']:.1f}") for name, t in snap['timers'].items()])
+        self._fill(self.tbl_rates, [(name, f"{rate * 100:.1f}%") for name, rate in snap['cache_hit_rates'].items()])
+        self._fill(self.tbl_counters, list(snap['counters'].items()))
+        self._fill(self.tbl_errors, [(e['source'], e['error']) for e in reversed(snap['recent_errors'])])
+
+    def on_reset(self):
+        self.metrics.reset(); self.refresh()
+
+    def on_export(self):
+        path, _ = QFileDialog.getSaveFileName(self, "Export Metrics", "metrics.json", "JSON (*.json)")
+        if path: self.metrics.to_json(path)
@@ -0,0 +1,190 @@
+"""
+Single-pass market offer extraction for csgoskins.gg item pages.
+"""
+import codecs
+import re
+from bisect import bisect_left
+from html.parser import HTMLParser
+from bs4 import BeautifulSoup, NavigableString, Tag
+from config import TARGET_MARKETS
+
+try:
+    import lxml  # noqa: F401
+    PARSER_BACKEND = "lxml"
+except ImportError:
+    PARSER_BACKEND = "html.parser"
+
+CONTAINER_TAGS = ("div", "tr")
+
+
+def build_matcher(markets):
+    """Compiles one case-insensitive alternation matching every market name (overlaps included)."""
+    names = sorted({m.lower() for m in markets}, key=len, reverse=True)
+    return re.compile("(?=(" + "|".join(re.escape(n) for n in names) + "))")
+
+
+DEFAULT_MATCHER = build_matcher(TARGET_MARKETS)
+
+
+def parse_document(content):
+    """Parses raw page bytes with the fastest installed backend."""
+    return BeautifulSoup(content, PARSER_BACKEND)
+
+
+def _parse_price(text):
+    try: return float(text.strip().replace("$", "").replace(",", ""))
+    except ValueError: return None
+
+
+def extract_offers(soup, markets=TARGET_MARKETS, matcher=None):
+    """
+    Walks the parsed document once, matching all market names at the same time.
+    For each market the first matching text node is used; its price is the first
+    '$' string at or after the opening of the nearest enclosing <div>/<tr>
+    (falling back to that container's parent), mirroring the page layout.
+    """
+    if matcher is None:
+        matcher = DEFAULT_MATCHER if markets is TARGET_MARKETS else build_matcher(markets)
+    canonical = {m.lower(): m for m in markets}
+
+    positions = {}
+    dollar_pos, dollar_text = [], []
+    hits = {}
+
+    for pos, node in enumerate(soup.descendants):
+        if isinstance(node, Tag):
+            positions[id(node)] = pos
+            continue
+        if not isinstance(node, NavigableString): continue
+        if "$" in node:
+            dollar_pos.append(pos); dollar_text.append(node)
+        if len(hits) == len(canonical): continue
+        for match in matcher.finditer(node.lower()):
+            key = match.group(1)
+            if key not in hits: hits[key] = node
+
+    offers = []
+    for key, market in canonical.items():
+        node = hits.get(key)
+        if node is None: continue
+        container = node.find_parent(CONTAINER_TAGS[0]) or node.find_parent(CONTAINER_TAGS[1])
+        if container is None: continue
+        idx = bisect_left(dollar_pos, positions[id(container)])
+        if idx == len(dollar_pos) and container.parent is not None:
+            idx = bisect_left(dollar_pos, positions.get(id(container.parent), 0))
+        if idx == len(dollar_pos): continue
+        price = _parse_price(dollar_text[idx])
+        if price is not None:
+            offers.append({"site": market, "price": price})
+    return offers
+
+
+def parse_offers(content, markets=TARGET_MARKETS):
+    """Convenience wrapper: raw page bytes in, offers list out."""
+    return extract_offers(parse_document(content), markets)
+
+
+VOID_TAGS = frozenset(("area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta",
+                       "param", "source", "track", "wbr"))
+
+
+class StreamingExtractor(HTMLParser):
+    """
+    Incremental counterpart of extract_offers for pages still downloading: feed() raw
+    chunks and collect offers from pop_offers() as soon as each one can be resolved.
+    Every open element remembers the first '$' text seen since it opened, so a market
+    whose container already holds a price resolves immediately; otherwise it waits for
+    the next '$' text (or, at close(), falls back to the container's parent).
+
+    HTMLParser hands over text cut at chunk boundaries, so data is buffered and only
+    matched as a whole text node once the next tag (or close()) ends it.
+    """
+    def __init__(self, markets=TARGET_MARKETS, encoding="utf-8"):
+        super().__init__(convert_charrefs=True)
+        self.matcher = DEFAULT_MATCHER if markets is TARGET_MARKETS else build_matcher(markets)
+        self.canonical = {m.lower(): m for m in markets}
+        self._decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+        self._stack = []        # [tag, first '$' text since the tag opened]
+        self._seen = set()
+        self._pending = []      # (market, parent stack entry or None) waiting for a '$' text
+        self._ready = []
+        self._text = []         # Pieces of the text node still being read
+
+    def feed_bytes(self, chunk):
+        self.feed(self._decoder.decode(chunk) if isinstance(chunk, bytes) else chunk)
+
+    def pop_offers(self):
+        ready, self._ready = self._ready, []
+        return ready
+
+    def handle_starttag(self, tag, attrs):
+        self._flush_text()
+        if tag not in VOID_TAGS: self._stack.append([tag, None])
+
+    def handle_endtag(self, tag):
+        self._flush_text()
+        for i in range(len(self._stack) - 1, -1, -1):
+            if self._stack[i][0] == tag:
+                del self._stack[i:]; return
+
+    def handle_data(self, text):
+        self._text.append(text)
+
+    def handle_comment(self, data):
+        self._flush_text()
+
+    handle_decl = handle_pi = unknown_decl = handle_comment
+
+    def _flush_text(self):
+        if not self._text: return
+        text = "".join(self._text)
+        self._text.clear()
+        self._match_text(text)
+
+    def _match_text(self, text):
+        if "$" in text:
+            for entry in reversed(self._stack):
+                if entry[1] is not None: break  # Outer elements already have an earlier '$' text
+                entry[1] = text
+            for market, _ in self._pending: self._resolve(market, text)
+            self._pending.clear()
+
+        if len(self._seen) == len(self.canonical): return
+        for match in self.matcher.finditer(text.lower()):
+            key = match.group(1)
+            if key in self._seen: continue
+            self._seen.add(key)
+            container = self._container()
+            if container is None: continue
+            idx, entry = container
+            if entry[1] is not None: self._resolve(self.canonical[key], entry[1])
+            else: self._pending.append((self.canonical[key], self._stack[idx - 1] if idx > 0 else None))
+
+    def _container(self):
+        for tag in CONTAINER_TAGS:
+            for idx in range(len(self._stack) - 1, -1, -1):
+                if self._stack[idx][0] == tag: return idx, self._stack[idx]
+        return None
+
+    def _resolve(self, market, text):
+        price = _parse_price(text)
+        if price is not None: self._ready.append({"site": market, "price": price})
+
+    def close(self):
+        self.feed(self._decoder.decode(b"", final=True))
+        super().close()
+        self._flush_text()
+        for market, parent in self._pending:
+            if parent is not None and parent[1] is not None: self._resolve(market, parent[1])
+        self._pending.clear()
+
+
+def iter_offers(chunks, markets=TARGET_MARKETS, encoding="utf-8"):
+    """Yields offers while raw page chunks are still arriving."""
+    parser = StreamingExtractor(markets, encoding)
+    for chunk in chunks:
+        parser.feed_bytes(chunk)
+        yield from parser.pop_offers()
+    parser.close()
+    yield from parser.pop_offers()
+
@@ -0,0 +1,690 @@
+"""
+PyQt5 GUI of the CS2 Market Arbitrage Tool: the main window and its run loop (started by main.py).
+"""
+from startup import STARTUP, warm_up  # First, so the startup report covers every import below
+import os
+import sys
+import time
+from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
+                             QHBoxLayout, QLabel, QLineEdit, QPushButton, 
+                             QProgressBar, QFrame, QListWidget, 
+                             QGraphicsDropShadowEffect, QListWidgetItem, QSizePolicy,
+                             QFileDialog, QShortcut, QSystemTrayIcon)
+from PyQt5.QtCore import Qt, QRegExp, QSize, QTimer, pyqtSignal
+from PyQt5.QtGui import QCursor, QColor, QRegExpValidator, QPixmap, QIcon, QKeySequence
+
+from config import GLOBAL_STYLE, OFFER_CACHE_PATH
+from autocomplete import Autocomplete
+from catalog import ItemCatalog, base_name
+from diagnostics_view import DiagnosticsDialog
+from metrics import METRICS, profiling
+from monitor import load_rules
+from image_cache import ImageCache
+from offer_cache import OfferCache
+from price_history import PriceHistory
+from results_view import OfferTableModel, ResultsView, offer_row
+from net_core import NetworkCore
+from workers import (DBWorker, ScraperWorker, BatchScraperWorker, MonitorWorker, IconLoader, load_thumbnail,
+                     HEADER_IMAGE_SIZE, ICON_SIZE)
+
+STARTUP.mark("imports")
+
+
+def build_scraper():
+    # cloudscraper, bs4 and the SSL context are only paid for here, on the warm-up thread
+    from markets import load_adapters
+    from scraper import SkinScraper
+    return SkinScraper(history=PriceHistory(), cache=OfferCache(path=OFFER_CACHE_PATH), adapters=load_adapters())
+
+
+class App(QMainWindow):
+    scraper_warmed = pyqtSignal()  # Emitted from the warm-up thread
+
+    def __init__(self):
+        super().__init__()
+        self.scraper_warmed.connect(self.on_scraper_warmed)
+        self._scraper = None  # Future of the SkinScraper, built once the window is up
+        self._after_warm_up = None  # Action retried once the warm-up finishes
+        self._ready = False
+        self.skin_database = ItemCatalog()
+        self.search_index = None
+        self.net = NetworkCore()
+        self.image_cache = ImageCache()
+        self.icon_loader = IconLoader(self.net, self.image_cache)
+        self.icon_loader.icon_loaded.connect(self.set_item_icon)
+        self.autocomplete = Autocomplete(parent=self)
+        self.autocomplete.results_ready.connect(self.show_suggestions)
+        self.header_load = None
+        self.worker = None
+        self.batch_worker = None
+        self.monitor_worker = None
+        self.tray = None
+        self.batch_results = {}
+        self.current_item = ""
+        self.header_url = None
+        self.diagnostics = None
+        self.banner = None
+        
+        self.setWindowTitle("CS2 Market Arbitrage Pro")
+        self.setMinimumSize(1600, 900)
+        self.logo = QPixmap("logo.png")  # Decoded once for the window icon and the header
+        self.setWindowIcon(QIcon(self.logo))
+        self.setStyleSheet(GLOBAL_STYLE)
+        
+        self.setup_ui()
+        QShortcut(QKeySequence("F12"), self, activated=self.toggle_diagnostics)
+        QShortcut(QKeySequence.Save, self, activated=self.export_snapshot)
+        QShortcut(QKeySequence.Open, self, activated=self.import_snapshot)
+        
+        self.db_thread = DBWorker(self.net)
+        self.db_thread.db_ready.connect(self.on_db_loaded)
+        self.db_thread.index_ready.connect(self.on_index_built)
+
+    @property
+    def scraper(self):
+        """The warmed-up SkinScraper, or None while it is still starting or if it failed to start."""
+        if self._scraper is None or not self._scraper.done() or self._scraper.exception() is not None: return None
+        return self._scraper.result()
+
+    def require_scraper(self, retry=None):
+        """
+        The scraper for a user action, without blocking the GUI thread: before the warm-up
+        finishes `retry` is queued to run once it has; a failed warm-up is shown in the results area.
+        """
+        if self._scraper is None: self.start_background_work()
+        if not self._scraper.done():
+            self._after_warm_up = retry
+            self.statusBar().showMessage("Starting the scraper...", 3000)
+            return None
+        error = self._scraper.exception()
+        if error is not None:
+            self.display_results({"error": f"The scraper failed to start: {error}"})
+            return None
+        return self._scraper.result()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self._scraper is None: QTimer.singleShot(0, self.on_first_paint)
+
+    def on_first_paint(self):
+        STARTUP.mark("first_paint")
+        self.start_background_work()
+
+    def start_background_work(self):
+        """Starts everything that can wait until the window is on screen: scraper warm-up and catalog load."""
+        if self._scraper is not None: return
+        self._scraper = warm_up("scraper", build_scraper)
+        self._scraper.add_done_callback(lambda f: self.scraper_warmed.emit())
+        self.db_thread.start()
+
+    def on_scraper_warmed(self):
+        retry, self._after_warm_up = self._after_warm_up, None
+        if self.scraper is not None:
+            if self.skin_database: self.scraper.set_catalog(self.skin_database)
+            self.check_startup_ready()
+        if retry is not None: retry()  # Shows the warm-up error if there was one
+
+    def check_startup_ready(self):
+        if self._ready or self.search_index is None or not self._scraper.done(): return
+        self._ready = True
+        STARTUP.mark("ready")
+        if os.environ.get("CS2_STARTUP_REPORT"): STARTUP.print_report()
+
+    def toggle_diagnostics(self):
+        if self.diagnostics is None: self.diagnostics = DiagnosticsDialog(self)
+        self.diagnostics.setVisible(not self.diagnostics.isVisible())
+
+    def on_db_loaded(self, catalog):
+        if not self.skin_database: STARTUP.mark("catalog_loaded")
+        self.skin_database = catalog
+        if self.scraper is not None: self.scraper.set_catalog(catalog)  # Otherwise on_scraper_warmed applies it
+
+    def on_index_built(self, index):
+        if self.search_index is None: STARTUP.mark("index_built")
+        self.search_index = index
+        self.autocomplete.set_index(index)
+        self.check_startup_ready()
+
+    def setup_ui(self):
+        """Constructs the main user interface."""
+        central_widget = QWidget()
+        self.setCentralWidget(central_widget)
+        main_layout = QVBoxLayout(central_widget)
+        main_layout.setContentsMargins(20, 20, 20, 20)
+        main_layout.setSpacing(15)
+
+        # --- Top Dashboard Panel ---
+        self.header_frame = QFrame()
+        self.header_frame.setObjectName("HeaderPanel")
+        self.header_frame.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
+        
+        shadow = QGraphicsDropShadowEffect()
+        shadow.setBlurRadius(15); shadow.setColor(QColor(0, 0, 0, 80)); shadow.setOffset(0, 5)
+        self.header_frame.setGraphicsEffect(shadow)
+
+        header_main_layout = QHBoxLayout(self.header_frame)
+        header_main_layout.setContentsMargins(30, 20, 30, 20)
+        header_main_layout.setSpacing(40)
+
+        # Left: Dynamic Image Preview
+        self.lbl_item_image = QLabel()
+        self.lbl_item_image.setFixedSize(140, 100)
+        self.lbl_item_image.setAlignment(Qt.AlignCenter)
+        self.lbl_item_image.setStyleSheet("background-color: transparent; border: none;")
+        header_main_layout.addWidget(self.lbl_item_image)
+
+        # Center: Main Inputs & Title
+        right_layout = QVBoxLayout()
+        right_layout.setSpacing(10)
+
+        self.lbl_title = QLabel("QES \nTRADE TERMINAL")
+        self.lbl_title.setObjectName("AppTitle")
+        self.lbl_title.setAlignment(Qt.AlignCenter)
+        
+        title_glow = QGraphicsDropShadowEffect()
+        title_glow.setBlurRadius(15); title_glow.setColor(QColor(0, 230, 118, 100)); title_glow.setOffset(0, 0)
+        self.lbl_title.setGraphicsEffect(title_glow)
+        right_layout.addWidget(self.lbl_title)
+
+        input_container = QHBoxLayout()
+        input_container.setSpacing(10)
+
+        label_style = "color: #9E9E9E; font-size: 11px; font-weight: bold; margin-bottom: 0px;"
+        INPUT_HEIGHT = 34 
+        number_validator = QRegExpValidator(QRegExp(r"^[0-9]*[.,]?[0-9]*$"))
+
+        vbox_search = QVBoxLayout(); vbox_search.setSpacing(2)
+        lbl_search = QLabel("ITEM NAME"); lbl_search.setStyleSheet(label_style)
+        self.entry_search = QLineEdit()
+        self.entry_search.setPlaceholderText("e.g., AK-47 | Redline (Field-Tested)")
+        self.entry_search.setMinimumWidth(380)
+        self.entry_search.setFixedHeight(INPUT_HEIGHT)
+        self.entry_search.textChanged.connect(self.on_search_type)
+        vbox_search.addWidget(lbl_search); vbox_search.addWidget(self.entry_search)
+
+        vbox_price = QVBoxLayout(); vbox_price.setSpacing(2)
+        lbl_price = QLabel("SELLING PRICE ($)"); lbl_price.setStyleSheet(label_style)
+        self.entry_price = QLineEdit()
+        self.entry_price.setPlaceholderText("Sell for...")
+        self.entry_price.setFixedWidth(110)
+        self.entry_price.setFixedHeight(INPUT_HEIGHT)
+        self.entry_price.setValidator(number_validator)
+        vbox_price.addWidget(lbl_price); vbox_price.addWidget(self.entry_price)
+
+        vbox_fee = QVBoxLayout(); vbox_fee.setSpacing(2)
+        lbl_fee = QLabel("FEE (%)"); lbl_fee.setStyleSheet(label_style)
+        self.entry_fee = QLineEdit()
+        self.entry_fee.setPlaceholderText("0.0")
+        self.entry_fee.setFixedWidth(70)
+        self.entry_fee.setFixedHeight(INPUT_HEIGHT)
+        self.entry_fee.setValidator(number_validator)
+        vbox_fee.addWidget(lbl_fee); vbox_fee.addWidget(self.entry_fee)
+
+        vbox_btn = QVBoxLayout(); vbox_btn.setSpacing(0)
+        vbox_btn.setAlignment(Qt.AlignBottom)
+        self.btn_search = QPushButton("CALCULATE DEALS")
+        self.btn_search.setObjectName("ActionBtn")
+        self.btn_search.setCursor(QCursor(Qt.PointingHandCursor))
+        self.btn_search.setFixedWidth(160)
+        self.btn_search.setFixedHeight(INPUT_HEIGHT)
+        self.btn_search.clicked.connect(self.start_search)
+        vbox_btn.addWidget(self.btn_search)
+
+        vbox_batch = QVBoxLayout(); vbox_batch.setSpacing(0)
+        vbox_batch.setAlignment(Qt.AlignBottom)
+        self.btn_batch = QPushButton("SCAN WATCHLIST")
+        self.btn_batch.setObjectName("ActionBtn")
+        self.btn_batch.setCursor(QCursor(Qt.PointingHandCursor))
+        self.btn_batch.setFixedWidth(160)
+        self.btn_batch.setFixedHeight(INPUT_HEIGHT)
+        self.btn_batch.clicked.connect(self.start_batch_scan)
+        vbox_batch.addWidget(self.btn_batch)
+
+        vbox_monitor = QVBoxLayout(); vbox_monitor.setSpacing(0)
+        vbox_monitor.setAlignment(Qt.AlignBottom)
+        self.btn_monitor = QPushButton("MONITOR ALERTS")
+        self.btn_monitor.setObjectName("ActionBtn")
+        self.btn_monitor.setCursor(QCursor(Qt.PointingHandCursor))
+        self.btn_monitor.setFixedWidth(160)
+        self.btn_monitor.setFixedHeight(INPUT_HEIGHT)
+        self.btn_monitor.clicked.connect(self.toggle_monitor)
+        vbox_monitor.addWidget(self.btn_monitor)
+
+        input_container.addStretch()
+        input_container.addLayout(vbox_search)
+        input_container.addLayout(vbox_price)
+        input_container.addLayout(vbox_fee)
+        input_container.addLayout(vbox_btn)
+        input_container.addLayout(vbox_batch)
+        input_container.addLayout(vbox_monitor)
+        input_container.addStretch()
+        
+        right_layout.addLayout(input_container)
+        header_main_layout.addLayout(right_layout)
+        
+        # Right: App Logo
+        self.lbl_app_logo = QLabel()
+        self.lbl_app_logo.setFixedSize(200, 140) 
+        self.lbl_app_logo.setAlignment(Qt.AlignCenter)
+        
+        if not self.logo.isNull():
+             self.lbl_app_logo.setPixmap(self.logo.scaled(200, 140, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+        header_main_layout.addWidget(self.lbl_app_logo)
+
+        main_layout.addWidget(self.header_frame, alignment=Qt.AlignTop | Qt.AlignHCenter)
+
+        # --- Autocomplete List (Floating Widget) ---
+        self.suggestion_list = QListWidget(self)
+        self.suggestion_list.setIconSize(QSize(50, 38)) 
+        self.suggestion_list.setStyleSheet("""
+            QListWidget {
+                background-color: #2A2A35; border: 1px solid #3d3d3d; 
+                border-radius: 6px; padding: 2px; font-size: 14px; color: #E0E0E0;
+            }
+            QListWidget::item { padding: 4px; border-bottom: 1px solid #32323E; border-radius: 4px; }
+            QListWidget::item:hover { background-color: #00C853; color: black; font-weight: bold;}
+        """)
+        list_shadow = QGraphicsDropShadowEffect()
+        list_shadow.setBlurRadius(15); list_shadow.setColor(QColor(0,0,0,150)); list_shadow.setOffset(0, 5)
+        self.suggestion_list.setGraphicsEffect(list_shadow)
+        self.suggestion_list.hide()
+        self.suggestion_list.itemClicked.connect(self.select_suggestion)
+
+        # --- Loading & Results Area ---
+        self.progress = QProgressBar()
+        self.progress.setStyleSheet("""
+            QProgressBar { border: none; background-color: #2A2A35; border-radius: 2px; height: 3px; }
+            QProgressBar::chunk { background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #00C853, stop:1 #2979FF); border-radius: 2px;}
+        """)
+        self.progress.setRange(0, 0)
+        self.progress.hide()
+        main_layout.addWidget(self.progress)
+
+        self.result_container = QWidget()
+        self.result_container.setStyleSheet("background-color: transparent;")
+        self.result_layout = QVBoxLayout(self.result_container)
+        self.result_layout.setContentsMargins(0, 0, 0, 0)
+        self.result_layout.setAlignment(Qt.AlignTop)
+        self.result_layout.setSpacing(10)
+        main_layout.addWidget(self.result_container)
+
+        self.results_model = OfferTableModel(self)
+        self.results_view = ResultsView(self.results_model)
+        main_layout.addWidget(self.results_view, 1)
+
+    # --- UI Logic Methods ---
+    def on_search_type(self):
+        query = self.entry_search.text().strip()
+        if len(query) < 2 or self.search_index is None:
+            self.hide_suggestions(); return
+        self.autocomplete.submit(query)
+
+    def hide_suggestions(self):
+        self.autocomplete.cancel(); self.icon_loader.cancel()
+        self.suggestion_list.hide()
+
+    def show_suggestions(self, generation, query, matches):
+        if generation != self.autocomplete.generation: return  # The user kept typing
+        self.update_header_image(query, partial=False)
+        if not matches: self.suggestion_list.hide(); self.icon_loader.cancel(); return
+
+        # Reuse the existing rows; only rows whose item changed are touched
+        lst = self.suggestion_list
+        while lst.count() > len(matches): lst.takeItem(lst.count() - 1)
+        requests_list = []
+        for idx, skin in enumerate(matches):
+            item = lst.item(idx)
+            if item is None:
+                item = QListWidgetItem(); lst.addItem(item)
+            elif item.text() == skin['name'] and item.data(Qt.UserRole) == skin['image']:
+                if skin['image'] and item.icon().isNull(): requests_list.append((idx, skin['image']))
+                continue
+            item.setText(skin['name'])
+            item.setData(Qt.UserRole, skin['image'])
+            item.setIcon(QIcon())
+            if skin['image']:
+                thumbnail = self.image_cache.get_thumbnail(skin['image'], ICON_SIZE)
+                if thumbnail is not None: item.setIcon(QIcon(QPixmap.fromImage(thumbnail)))
+                else: requests_list.append((idx, skin['image']))
+
+        pos = self.entry_search.mapTo(self, self.entry_search.rect().bottomLeft())
+        lst.setGeometry(pos.x(), pos.y() + 2, self.entry_search.width(), 300)
+        if not lst.isVisible(): lst.show(); lst.raise_()
+        
+        self.icon_loader.request(requests_list)
+
+    def set_item_icon(self, row, url, image):
+        if row < self.suggestion_list.count():
+            item = self.suggestion_list.item(row)
+            if item and item.data(Qt.UserRole) == url: item.setIcon(QIcon(QPixmap.fromImage(image)))
+
+    def update_header_image(self, skin_name, partial=True):
+        """Shows the item's image in the header; partial=False (live preview) only takes a base-name hit."""
+        if len(base_name(skin_name)) < 2: return
+
+        skin_data = self.skin_database.get_base(skin_name)
+        if not skin_data and partial and self.search_index is not None:
+            hits = self.search_index.search(base_name(skin_name), limit=1)
+            skin_data = hits[0] if hits else None
+        if not skin_data and not partial: return
+
+        url = skin_data['image'] if skin_data else ""
+        if url == self.header_url: return
+        self.header_url = url
+        if url:
+            thumbnail = self.image_cache.get_thumbnail(url, HEADER_IMAGE_SIZE)
+            if thumbnail is not None:
+                self.display_header_image(thumbnail)
+            else:
+                # Live previews can outpace downloads; only the latest one is worth finishing
+                if self.header_load is not None: self.header_load.cancel()
+                self.header_load = self.net.submit(
+                    load_thumbnail(self.net, self.image_cache, url, HEADER_IMAGE_SIZE, timeout=5),
+                    lambda image, error, url=url: self.on_header_image_loaded(url, image, error))
+        else:
+            self.lbl_item_image.clear()
+            self.lbl_item_image.setStyleSheet("background-color: transparent; border: none;")
+
+    def on_header_image_loaded(self, url, image, error):
+        if error is not None: METRICS.error("header_image", error)
+        elif image is not None and url == self.header_url: self.display_header_image(image)
+
+    def display_header_image(self, image):
+        self.lbl_item_image.setPixmap(QPixmap.fromImage(image))
+        self.lbl_item_image.setStyleSheet("background-color: transparent; border: none;")
+
+    def select_suggestion(self, item):
+        selected_name = item.text()
+        self.entry_search.setText(selected_name)
+        self.hide_suggestions()
+        self.entry_price.setFocus()
+        self.update_header_image(selected_name)
+
+    def mousePressEvent(self, event):
+        self.hide_suggestions()
+        super().mousePressEvent(event)
+
+    def start_search(self):
+        self.hide_suggestions()
+        name = self.entry_search.text()
+        if not name: return
+        scraper = self.require_scraper(self.start_search)
+        if scraper is None: return
+        
+        self.update_header_image(name)
+        
+        self.btn_search.setText("SCANNING..."); self.btn_search.setEnabled(False); self.progress.show()
+        self.clear_results()
+        self.current_item = name
+            
+        self.worker = ScraperWorker(scraper, name)
+        self.worker.result_ready.connect(self.display_results)
+        self.worker.offer_ready.connect(self.display_offer)
+        self.worker.start()
+
+    def clear_results(self, keep_rows=False):
+        for i in reversed(range(self.result_layout.count())): 
+            widget = self.result_layout.itemAt(i).widget()
+            if widget: widget.deleteLater()
+        self.banner = None
+        if not keep_rows: self.results_model.set_rows([])
+
+    def read_price_inputs(self):
+        """Returns (selling_price, fee_percent) from the input fields, defaulting to 0."""
+        try: price_val = float(self.entry_price.text().replace(",", ".")) if self.entry_price.text() else 0.0
+        except ValueError: price_val = 0.0
+        try: fee_val = float(self.entry_fee.text().replace(",", ".")) if self.entry_fee.text() else 0.0
+        except ValueError: fee_val = 0.0
+        return price_val, fee_val
+
+    def start_batch_scan(self):
+        if self.batch_worker and self.batch_worker.isRunning():
+            self.batch_worker.cancel(); return
+        scraper = self.require_scraper(self.start_batch_scan)
+        if scraper is None: return
+
+        path, _ = QFileDialog.getOpenFileName(self, "Open Watchlist", "", "Watchlist (*.txt);;All Files (*)")
+        if not path: return
+        from scraper import read_watchlist
+        with open(path, encoding="utf-8") as f:
+            names = read_watchlist(f)
+        if not names: return
+
+        self.hide_suggestions()
+        self.clear_results()
+        self.batch_results = {}
+        self.results_view.set_batch_mode(True)
+        self.results_model.set_net_income(0.0)
+        self.btn_batch.setText("STOP SCAN"); self.btn_search.setEnabled(False); self.btn_monitor.setEnabled(False)
+        self.progress.setRange(0, len(names)); self.progress.setValue(0); self.progress.show()
+
+        self.batch_worker = BatchScraperWorker(scraper, names)
+        self.batch_worker.item_ready.connect(self.display_batch_result)
+        self.batch_worker.progress.connect(lambda done, total: self.progress.setValue(done))
+        self.batch_worker.finished.connect(self.on_batch_finished)
+        self.batch_worker.start()
+
+    def on_batch_finished(self):
+        self.progress.hide(); self.progress.setRange(0, 0)
+        self.btn_batch.setText("SCAN WATCHLIST"); self.btn_search.setEnabled(True); self.btn_monitor.setEnabled(True)
+        self.show_opportunities()
+
+    def toggle_monitor(self):
+        if self.monitor_worker and self.monitor_worker.isRunning():
+            self.monitor_worker.cancel(); self.btn_monitor.setText("STOPPING..."); self.btn_monitor.setEnabled(False)
+            return
+        scraper = self.require_scraper(self.toggle_monitor)
+        if scraper is None: return
+
+        path, _ = QFileDialog.getOpenFileName(self, "Open Alert Rules", "", "Alert rules (*.json);;All Files (*)")
+        if not path: return
+        try:
+            rules = load_rules(path)
+        except (OSError, ValueError) as e:
+            self.notify(f"Could not load alert rules: {e}"); return
+        if not rules: return
+
+        self.hide_suggestions()
+        self.clear_results()
+        self.batch_results = {}
+        self.results_view.set_batch_mode(True)
+        self.results_model.set_net_income(0.0)
+        self.btn_monitor.setText("STOP MONITOR"); self.btn_batch.setEnabled(False); self.btn_search.setEnabled(False)
+
+        self.monitor_worker = MonitorWorker(scraper, rules)
+        self.monitor_worker.item_ready.connect(self.display_batch_result)
+        self.monitor_worker.alert.connect(lambda alert: self.notify(alert['message'], "Price alert"))
+        self.monitor_worker.finished.connect(self.on_monitor_finished)
+        self.monitor_worker.start()
+
+    def on_monitor_finished(self):
+        self.btn_monitor.setText("MONITOR ALERTS"); self.btn_monitor.setEnabled(True)
+        self.btn_batch.setEnabled(True); self.btn_search.setEnabled(True)
+
+    def notify(self, message, title="CS2 Trade Terminal"):
+        """Desktop notification through the system tray, or the status bar where there is none."""
+        if QSystemTrayIcon.isSystemTrayAvailable():
+            if self.tray is None:
+                self.tray = QSystemTrayIcon(self.windowIcon(), self)
+                self.tray.show()
+            self.tray.showMessage(title, message, QSystemTrayIcon.Information, 8000)
+        else:
+            self.statusBar().showMessage(f"{title}: {message}", 15000)
+        QApplication.alert(self)
+
+    def show_opportunities(self, top_n=10):
+        """Ranks the scanned watchlist across all markets and pins the best deals above the item rows."""
+        if not self.batch_results: return
+        from arbitrage import build_price_matrix, find_opportunities  # numpy is only loaded for batch scans
+        items, prices = build_price_matrix(self.batch_results)
+        price_val, fee_val = self.read_price_inputs()
+        if price_val > 0:
+            ranked = find_opportunities(items, prices, sell=price_val, fees=fee_val, top_n=top_n)
+        else:
+            ranked = find_opportunities(items, prices, top_n=top_n)
+        ranked = [r for r in ranked if r['profit'] > 0]
+        if not ranked: return
+
+        board = QFrame()
+        board.setObjectName("BestDealBanner")
+        board_layout = QVBoxLayout(board)
+        board_layout.setContentsMargins(20, 15, 20, 15)
+        lbl_board_title = QLabel(f"🔥 TOP {len(ranked)} OPPORTUNITIES")
+        lbl_board_title.setStyleSheet("color: #00E676; font-weight: 900; font-size: 12px; letter-spacing: 1px;")
+        board_layout.addWidget(lbl_board_title)
+
+        for opp in ranked:
+            target = opp['sell_market'] or "your price"
+            row = QLabel(f"<b>{opp['item']}</b> &nbsp; buy {opp['buy_market']} ${opp['buy_price']:.2f} → "
+                         f"sell {target} net ${opp['sell_net']:.2f} &nbsp; "
+                         f"<span style='color:#00E676'>+${opp['profit']:.2f} ({opp['margin'] * 100:.1f}%)</span>")
+            row.setStyleSheet("color: white; font-size: 14px;")
+            board_layout.addWidget(row)
+        self.result_layout.insertWidget(0, board)
+
+    def export_snapshot(self):
+        """Ctrl+S: writes the rows in the results table to a columnar snapshot file."""
+        rows = [r for r in self.results_model.rows() if 'error' not in r]
+        if not rows: return
+        from snapshots import SnapshotWriter, SNAPSHOT_EXTENSIONS, DEFAULT_EXTENSION
+        filters = ";;".join(f"{ext[1:].capitalize()} (*{ext})" for ext in SNAPSHOT_EXTENSIONS)
+        path, _ = QFileDialog.getSaveFileName(self, "Export Snapshot", f"snapshot{DEFAULT_EXTENSION}", filters)
+        if not path: return
+        try:
+            with SnapshotWriter(path) as writer:
+                for r in rows:
+                    profit = self.results_model.profit(r)
+                    writer.add_row(r['item'], r['site'], r['price'], r['ts'],
+                                   float("nan") if profit is None else profit)
+        except (OSError, ValueError) as e:
+            self.notify(f"Could not export snapshot: {e}"); return
+        self.statusBar().showMessage(f"Exported {writer.rows} rows to {path}", 8000)
+
+    def import_snapshot(self):
+        """Ctrl+O: reloads a snapshot into the batch results view, newest quote per item and market."""
+        if any(w and w.isRunning() for w in (self.batch_worker, self.monitor_worker)): return
+        from snapshots import latest_offers, SNAPSHOT_EXTENSIONS
+        patterns = " ".join(f"*{ext}" for ext in SNAPSHOT_EXTENSIONS)
+        path, _ = QFileDialog.getOpenFileName(self, "Open Snapshot", "", f"Snapshots ({patterns});;All Files (*)")
+        if not path: return
+        try:
+            with METRICS.timer("snapshot.load"):
+                results = latest_offers(path)
+        except (OSError, ValueError, KeyError) as e:
+            self.notify(f"Could not load snapshot: {e}"); return
+
+        self.hide_suggestions()
+        self.clear_results()
+        self.batch_results = {}
+        self.results_view.set_batch_mode(True)
+        self.results_model.set_net_income(0.0)
+        for name, offers in results.items():
+            self.display_batch_result(name, {"offers": offers})
+        self.show_opportunities()
+        self.statusBar().showMessage(f"Loaded {len(results)} items from {path}", 8000)
+
+    def display_batch_result(self, name, data):
+        """Merges one scanned watchlist item into the results table as results stream in."""
+        if "error" in data:
+            self.results_model.set_item_rows(name, [{'item': name, 'site': None, 'error': data['error']}])
+            return
+        self.batch_results[name] = data["offers"]
+        fetched = time.time() - data.get("cached_age", 0.0)
+        self.results_model.set_item_rows(name, [offer_row(name, o, fetched) for o in data["offers"]])
+
+    def build_banner(self, best):
+        """Best Deal Banner Generation; its labels are kept so streamed offers can update it."""
+        banner = QFrame()
+        banner.setObjectName("BestDealBanner")
+        banner_layout = QHBoxLayout(banner)
+        banner_layout.setContentsMargins(20, 15, 20, 15)
+        
+        best_info = QVBoxLayout()
+        lbl_best_title = QLabel("🔥 BEST PRICE FOUND")
+        lbl_best_title.setStyleSheet("color: #00E676; font-weight: 900; font-size: 12px; letter-spacing: 1px;")
+        self.lbl_best_site = QLabel(best['site'])
+        self.lbl_best_site.setStyleSheet("color: white; font-weight: bold; font-size: 24px;")
+        best_info.addWidget(lbl_best_title); best_info.addWidget(self.lbl_best_site)
+        
+        self.lbl_best_price = QLabel(f"${best['price']:.2f}")
+        self.lbl_best_price.setStyleSheet("color: #00E676; font-weight: 900; font-size: 36px;")
+        
+        banner_layout.addLayout(best_info); banner_layout.addStretch(); banner_layout.addWidget(self.lbl_best_price)
+        self.banner, self.banner_best = banner, dict(best)
+        return banner
+
+    def display_offer(self, offer):
+        """Inserts one streamed offer into the sorted table and keeps the banner on the cheapest so far."""
+        if self.banner is None:
+            price_val, fee_val = self.read_price_inputs()
+            self.results_view.set_batch_mode(False)
+            self.results_model.set_net_income(price_val * (1 - (fee_val / 100)))
+            self.result_layout.insertWidget(0, self.build_banner(offer))
+        elif offer['price'] < self.banner_best['price']:
+            self.banner_best = dict(offer)
+            self.lbl_best_site.setText(offer['site'])
+            self.lbl_best_price.setText(f"${offer['price']:.2f}")
+        self.results_model.upsert_row(offer_row(self.current_item, offer, time.time()))
+
+    def display_results(self, data):
+        self.clear_results(keep_rows=True)
+        if not data.get("stale"):
+            self.progress.hide()
+            self.btn_search.setText("CALCULATE DEALS")
+            self.btn_search.setEnabled(True)
+        
+        if "error" in data:
+            err_lbl = QLabel(f"⚠️ {data['error']}")
+            err_lbl.setStyleSheet("color: #FF5555; font-size: 16px; font-weight: bold; padding: 10px;")
+            err_lbl.setAlignment(Qt.AlignCenter)
+            self.results_model.set_rows([])
+            self.result_layout.addWidget(err_lbl); return
+
+        offers_sorted = sorted(data["offers"], key=lambda x: x['price'])
+        price_val, fee_val = self.read_price_inputs()
+        
+        net_income = price_val * (1 - (fee_val / 100))
+
+        self.result_layout.addWidget(self.build_banner(offers_sorted[0]))
+
+        if "cached_age" in data:
+            note = "refreshing..." if data.get("stale") else "cached"
+            age_lbl = QLabel(f"⏱ Prices from {int(data['cached_age'])}s ago ({note})")
+            age_lbl.setStyleSheet("color: #757575; font-size: 12px; margin-left: 5px;")
+            self.result_layout.addWidget(age_lbl)
+
+        if price_val > 0:
+            net_lbl = QLabel(f"Your Net Income (after {fee_val}% fee): <b>${net_income:.2f}</b>")
+            net_lbl.setStyleSheet("color: #90CAF9; font-size: 14px; margin-top: 5px; margin-left: 5px;")
+            self.result_layout.addWidget(net_lbl)
+
+        # Offer rows are diffed into the model; the view paints them on demand
+        self.results_view.set_batch_mode(False)
+        self.results_model.set_net_income(net_income)
+        fetched = time.time() - data.get("cached_age", 0.0)
+        self.results_model.set_rows([offer_row(self.current_item, o, fetched) for o in offers_sorted])
+
+def main():
+    """Runs the application until its window closes; returns the exit code."""
+    with STARTUP.phase("qt_init"):
+        # High-DPI attributes only take effect when set before the QApplication exists
+        if hasattr(Qt, 'AA_EnableHighDpiScaling'): 
+            QApplication.setAttribute(Qt.AA_EnableHighDpiScaling, True)
+        if hasattr(Qt, 'AA_UseHighDpiPixmaps'): 
+            QApplication.setAttribute(Qt.AA_UseHighDpiPixmaps, True)
+        app = QApplication(sys.argv)
+        
+    # CS2_PROFILE=<file.prof> runs the GUI thread under cProfile; CS2_METRICS=<file.json> dumps metrics on exit;
+    # CS2_STARTUP_REPORT=1 prints the startup phase timings once the scraper and search index are ready
+    with profiling(os.environ.get("CS2_PROFILE")):
+        with STARTUP.phase("build_window"):
+            window = App()
+            window.show()
+        exit_code = app.exec_()
+        # Running scan threads must stop before their QThread objects are destroyed
+        for worker in (window.worker, window.batch_worker, window.monitor_worker):
+            if worker: worker.cancel(); worker.wait()
+        if window.scraper is not None: window.scraper.close()  # None if the warm-up failed (or never finished)
+        window.net.close()
+    if os.environ.get("CS2_METRICS"): METRICS.to_json(os.environ["CS2_METRICS"])
+    return exit_code
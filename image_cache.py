@@ -0,0 +1,115 @@
+"""
+Two-tier, thread-safe image cache shared by the icon and header image loaders.
+"""
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from config import IMAGE_CACHE_DIR, IMAGE_MEMORY_BUDGET, THUMBNAIL_MEMORY_BUDGET
+from metrics import METRICS
+
+
+class _LRU:
+    """Byte-budgeted LRU map; callers hold the cache lock."""
+    def __init__(self, budget):
+        self.budget = budget
+        self.used = 0
+        self.entries = OrderedDict()
+
+    def get(self, key):
+        entry = self.entries.get(key)
+        if entry is None: return None
+        self.entries.move_to_end(key)
+        return entry[0]
+
+    def put(self, key, value, cost):
+        if cost > self.budget: return
+        old = self.entries.pop(key, None)
+        if old is not None: self.used -= old[1]
+        self.entries[key] = (value, cost)
+        self.used += cost
+        while self.used > self.budget:
+            _, (_, evicted_cost) = self.entries.popitem(last=False)
+            self.used -= evicted_cost
+
+
+class ImageCache:
+    """
+    Raw image bytes live in a memory LRU in front of a content-addressed disk store
+    (blobs/<sha256 of content>, refs/<sha1 of url> -> digest) that survives restarts.
+    Decoded, downscaled thumbnails (any object, e.g. QImage) are kept per (url, size)
+    in a separate memory budget so the UI never decodes the same PNG twice.
+    """
+    def __init__(self, directory=IMAGE_CACHE_DIR, memory_budget=IMAGE_MEMORY_BUDGET,
+                 thumbnail_budget=THUMBNAIL_MEMORY_BUDGET):
+        self.directory = directory
+        self._lock = threading.Lock()
+        self._raw = _LRU(memory_budget)
+        self._thumbs = _LRU(thumbnail_budget)
+
+    # --- Disk tier ---
+    def _ref_path(self, url):
+        return os.path.join(self.directory, "refs", hashlib.sha1(url.encode("utf-8")).hexdigest())
+
+    def _blob_path(self, digest):
+        return os.path.join(self.directory, "blobs", digest[:2], digest)
+
+    def _read_disk(self, url):
+        try:
+            with open(self._ref_path(url), encoding="ascii") as f:
+                digest = f.read().strip()
+            with open(self._blob_path(digest), "rb") as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def _write_disk(self, url, data):
+        digest = hashlib.sha256(data).hexdigest()
+        try:
+            blob = self._blob_path(digest)
+            if not os.path.exists(blob): _atomic_write(blob, data)
+            _atomic_write(self._ref_path(url), digest.encode("ascii"))
+        except OSError as e:
+            METRICS.error("image_cache", e)
+            print(f"ImageCache Error: {e}")
+
+    # --- Public API ---
+    def get(self, url):
+        """Returns the raw bytes for `url` from memory or disk, or None."""
+        with self._lock:
+            data = self._raw.get(url)
+        METRICS.cache("image_cache.memory", data is not None)
+        if data is not None: return data
+        data = self._read_disk(url)
+        METRICS.cache("image_cache.disk", data is not None)
+        if data is not None:
+            with self._lock: self._raw.put(url, data, len(data))
+        return data
+
+    def put(self, url, data, persist=True):
+        with self._lock:
+            self._raw.put(url, data, len(data))
+        if persist: self._write_disk(url, data)
+
+    def __contains__(self, url):
+        with self._lock:
+            if url in self._raw.entries: return True
+        return os.path.exists(self._ref_path(url))
+
+    def get_thumbnail(self, url, size):
+        with self._lock:
+            image = self._thumbs.get((url, size))
+        METRICS.cache("image_cache.thumbnail", image is not None)
+        return image
+
+    def put_thumbnail(self, url, size, image, cost):
+        with self._lock:
+            self._thumbs.put((url, size), image, cost)
+
+
+def _atomic_write(path, data):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f"{path}.{threading.get_ident()}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
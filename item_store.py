@@ -0,0 +1,80 @@
+"""
+Persistent local copy of the processed item catalog (name -> image URL).
+"""
+import os
+import pickle
+import sqlite3
+from contextlib import contextmanager
+from catalog import ItemCatalog
+from config import ITEM_DB_PATH
+
+
+def process_catalog(data):
+    """Turns the raw ByMykel all.json payload into the ItemCatalog used by the app."""
+    temp_db = {}
+    for item in data.values():
+        if isinstance(item, dict) and 'name' in item:
+            clean_name = item['name'].replace("★ ", "").strip()
+            if clean_name not in temp_db:
+                image_url = item.get('image') or item.get('image_url') or item.get('icon_url') or ""
+                temp_db[clean_name] = image_url
+    return ItemCatalog(temp_db.items())
+
+
+class ItemStore:
+    """
+    SQLite-backed item catalog plus the HTTP validators (ETag / Last-Modified) it was built from.
+    The catalog is kept as a single pickled blob, so loading it is one read and no per-row work.
+    """
+    SCHEMA_VERSION = "4"
+
+    def __init__(self, path=ITEM_DB_PATH):
+        self.path = path
+
+    @contextmanager
+    def _connect(self):
+        """Opens the database (migrating it if the schema changed) as one transaction."""
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        conn = sqlite3.connect(self.path)
+        conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+        row = conn.execute("SELECT value FROM meta WHERE key = 'schema'").fetchone()
+        if row is None or row[0] != self.SCHEMA_VERSION:
+            with conn:
+                # The pickled catalog's layout follows the schema version too, so it goes with it
+                conn.execute("DROP TABLE IF EXISTS items"); conn.execute("DROP TABLE IF EXISTS catalog")
+                conn.execute("DELETE FROM meta")
+                conn.execute("INSERT INTO meta VALUES ('schema', ?)", (self.SCHEMA_VERSION,))
+        conn.execute("CREATE TABLE IF NOT EXISTS catalog (id INTEGER PRIMARY KEY CHECK (id = 0), data BLOB NOT NULL)")
+        try:
+            with conn: yield conn
+        finally:
+            conn.close()
+
+    def load(self):
+        """Returns the stored catalog (empty if nothing was saved yet)."""
+        try:
+            with self._connect() as conn:
+                row = conn.execute("SELECT data FROM catalog WHERE id = 0").fetchone()
+            catalog = pickle.loads(row[0]) if row else None
+            return catalog if isinstance(catalog, ItemCatalog) else ItemCatalog()
+        except (sqlite3.Error, pickle.UnpicklingError, EOFError, AttributeError) as e:
+            print(f"ItemStore Error: {e}")
+            return ItemCatalog()
+
+    def validators(self):
+        """Returns (etag, last_modified) of the stored copy, or (None, None)."""
+        try:
+            with self._connect() as conn:
+                meta = dict(conn.execute("SELECT key, value FROM meta WHERE key IN ('etag', 'last_modified')"))
+        except sqlite3.Error:
+            return None, None
+        return meta.get('etag'), meta.get('last_modified')
+
+    def save(self, catalog, etag=None, last_modified=None):
+        """Atomically replaces the stored catalog and its validators."""
+        data = pickle.dumps(catalog, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._connect() as conn:
+            conn.execute("INSERT OR REPLACE INTO catalog (id, data) VALUES (0, ?)", (data,))
+            conn.execute("DELETE FROM meta WHERE key IN ('etag', 'last_modified')")
+            conn.executemany("INSERT INTO meta VALUES (?, ?)",
+                             [(k, v) for k, v in (('etag', etag), ('last_modified', last_modified)) if v])
@@ -0,0 +1,253 @@
+"""
+Pluggable price sources. The csgoskins.gg page is one adapter; per-market JSON endpoints
+are others. PriceAggregator queries them all in parallel, each under its own timeout,
+and merges their offers per market, keeping the freshest quote.
+"""
+import json
+import math
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from urllib.parse import quote
+
+import requests
+from config import (MARKET_ADAPTERS_PATH, ADAPTER_TIMEOUT, HTML_ADAPTER_TIMEOUT, AGGREGATOR_GRACE,
+                    ADAPTER_MAX_IN_FLIGHT, ADAPTER_BREAKER_TIMEOUTS, ADAPTER_BREAKER_COOLDOWN)
+from metrics import METRICS
+from rate_limiter import CircuitBreaker, time_left
+from scraper import ScrapeError
+
+POLL_INTERVAL = 0.1  # How often stream() checks whether a queued source has started
+
+
+class MarketAdapter(ABC):
+    """
+    One price source. fetch() returns offers [{'site', 'price', 'ts'}] for an item and
+    raises ScrapeError when the source has nothing for it, or requests.Timeout once its
+    deadline passed. `timeout` is the total time one call gets; a `grace_exempt` source
+    is not cut short by the grace period either.
+    """
+    name = "adapter"
+    timeout = ADAPTER_TIMEOUT
+    grace_exempt = False
+
+    @abstractmethod
+    def fetch(self, scraper, raw_name, parse=None, deadline=None):
+        """
+        Offers for `raw_name`; `parse` is the scraper's page parser, for sources that fetch HTML.
+        Nothing may run past `deadline` (a time.monotonic() value).
+        """
+
+
+class CsgoskinsAdapter(MarketAdapter):
+    """
+    The csgoskins.gg item page: every TARGET_MARKETS quote scraped from one HTML document.
+    It is the primary source and usually the slowest, so it only ever times out.
+    """
+    name = "csgoskins"
+    grace_exempt = True
+
+    def __init__(self, timeout=HTML_ADAPTER_TIMEOUT):
+        self.timeout = timeout
+
+    def fetch(self, scraper, raw_name, parse=None, deadline=None):
+        ts = time.time()
+        return [dict(o, ts=ts) for o in scraper.page_offers(raw_name, parse, deadline)]
+
+
+class JsonMarketAdapter(MarketAdapter):
+    """
+    A single market's JSON endpoint. `url` is a template with {slug}, {condition} and
+    {name} (the quoted market hash name). The price is read at the dotted path `price`,
+    from each element of the list at `listings` when given (the cheapest one wins), and
+    multiplied by `scale` (0.01 for cents). `ts` optionally names the quote's epoch time.
+    """
+    def __init__(self, market, url, price="price", listings=None, ts=None, scale=1.0, timeout=ADAPTER_TIMEOUT,
+                 grace_exempt=False):
+        self.name = self.market = market
+        self.url = url
+        self.price_path, self.listings_path, self.ts_path = price, listings, ts
+        self.scale = scale
+        self.timeout = timeout
+        self.grace_exempt = grace_exempt
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(str(data['market']), str(data['url']), data.get('price', "price"), data.get('listings'),
+                   data.get('ts'), float(data.get('scale', 1.0)), float(data.get('timeout', ADAPTER_TIMEOUT)),
+                   bool(data.get('grace_exempt', False)))
+
+    def item_url(self, scraper, raw_name):
+        name_slug, condition_slug = scraper.parse_input(raw_name)
+        return self.url.format(slug=name_slug, condition=condition_slug or "", name=quote(raw_name.strip(), safe=""))
+
+    def fetch(self, scraper, raw_name, parse=None, deadline=None):
+        url = self.item_url(scraper, raw_name)
+        send = lambda: scraper.scraper.get(url, timeout=max(0.01, time_left(deadline, self.timeout)))
+        response = scraper.scheduler.request(url, send, deadline=deadline, retries=0)
+        METRICS.incr(f"market.{self.name}.status.{response.status_code}")
+        if response.status_code == 404: raise ScrapeError(f"{self.market}: item not listed")
+        if response.status_code != 200: raise ScrapeError(f"{self.market}: site error {response.status_code}")
+        try:
+            return self.parse(response.json())
+        except (ValueError, TypeError, KeyError) as e:
+            raise ScrapeError(f"{self.market}: unexpected response ({e})") from e
+
+    def parse(self, doc):
+        fetched = time.time()
+        entries = _lookup(doc, self.listings_path) if self.listings_path else [doc]
+        best = None
+        for entry in entries or ():
+            value = _lookup(entry, self.price_path)
+            if value is None: continue
+            price = round(float(value) * self.scale, 2)
+            if price > 0 and (best is None or price < best[0]):
+                ts = _lookup(entry, self.ts_path) if self.ts_path else None
+                best = (price, float(ts) if ts is not None else fetched)
+        if best is None: raise ScrapeError(f"{self.market}: no listings")
+        return [{"site": self.market, "price": best[0], "ts": best[1]}]
+
+
+def _lookup(doc, path):
+    for key in path.split("."):
+        if doc is None: return None
+        doc = doc[int(key)] if isinstance(doc, list) else doc.get(key)
+    return doc
+
+
+def load_adapters(path=MARKET_ADAPTERS_PATH):
+    """
+    Reads a JSON list of endpoint definitions ({"market": ..., "url": ...}). A missing or
+    unreadable file means no extra sources; malformed entries are skipped and logged.
+    """
+    try:
+        with open(path, encoding="utf-8") as f:
+            entries = json.load(f)
+    except FileNotFoundError:
+        return []
+    except (OSError, ValueError) as e:
+        METRICS.error("markets", e); print(f"Market adapters Error: {path}: {e}")
+        return []
+    if not isinstance(entries, list):
+        print(f"Market adapters Error: {path}: expected a JSON list of endpoints")
+        return []
+
+    adapters = []
+    for n, entry in enumerate(entries):
+        try:
+            if not isinstance(entry, dict): raise TypeError("entry is not an object")
+            if not entry.get('market') or not entry.get('url'): raise KeyError("market and url are required")
+            adapter = JsonMarketAdapter.from_dict(entry)
+        except (ValueError, TypeError, KeyError, AttributeError) as e:
+            METRICS.error("markets", e); print(f"Market adapters Error: {path}: entry {n} skipped ({e})")
+            continue
+        adapters.append(adapter)
+    return adapters
+
+
+class PriceAggregator:
+    """
+    Runs every adapter for an item, each on its own small pool so a blocked source only
+    queues its own calls. A call gets its adapter's timeout as one deadline from the moment
+    it starts (time spent queued is not charged), and is given up on at that deadline or,
+    unless the adapter is grace_exempt, `grace` seconds after the first source answered,
+    so slow secondary sources cost a scan little (grace=None waits for each one up to its
+    timeout). A source whose calls keep timing out is skipped for a cooldown by its circuit
+    breaker. Offers are deduped by market, keeping the quote with the newest 'ts' (the
+    lower price on a tie).
+    """
+    def __init__(self, adapters, grace=AGGREGATOR_GRACE, max_in_flight=ADAPTER_MAX_IN_FLIGHT):
+        self.adapters = list(adapters)
+        self.grace = grace
+        self._pools = {a: ThreadPoolExecutor(max_workers=max(1, max_in_flight), thread_name_prefix=f"market-{a.name}")
+                       for a in self.adapters}
+        self._breakers = {a: CircuitBreaker(ADAPTER_BREAKER_TIMEOUTS, ADAPTER_BREAKER_COOLDOWN) for a in self.adapters}
+
+    def stream(self, scraper, raw_name, parse=None):
+        """Yields (adapter, offers, error) as each source finishes; timed-out sources yield a timeout error."""
+        started = {}  # adapter -> time.monotonic() its call began, set on the pool thread
+        futures = {self._pools[a].submit(self._run, a, scraper, raw_name, parse, started): a for a in self.adapters}
+        first = None
+
+        def deadline(f):
+            adapter = futures[f]
+            begun = started.get(adapter)
+            end = begun + adapter.timeout if begun is not None else math.inf
+            if first is None or self.grace is None or adapter.grace_exempt: return end
+            return min(end, first + self.grace)
+
+        pending = set(futures)
+        while pending:
+            cutoff = min(deadline(f) for f in pending)
+            timeout = None if cutoff == math.inf else max(0.0, cutoff - time.monotonic())
+            if any(futures[f] not in started for f in pending):
+                timeout = POLL_INTERVAL if timeout is None else min(timeout, POLL_INTERVAL)
+            done, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+            for f in done:
+                adapter = futures[f]
+                offers, error = f.result()
+                if first is None and offers: first = time.monotonic()
+                yield adapter, offers, error
+            now = time.monotonic()
+            expired = {f for f in pending if now >= deadline(f)}
+            for f in expired:
+                f.cancel()  # A call still queued never starts; a running one stops at its own deadline
+                METRICS.incr(f"market.{futures[f].name}.timeout")
+                yield futures[f], None, f"{futures[f].name}: timed out"
+            pending -= expired
+
+    def _run(self, adapter, scraper, raw_name, parse, started):
+        started[adapter] = time.monotonic()
+        breaker = self._breakers[adapter]
+        if not breaker.allow():
+            METRICS.incr(f"market.{adapter.name}.skipped")
+            return None, f"{adapter.name}: skipped after repeated timeouts"
+        start = time.perf_counter()
+        try:
+            offers = adapter.fetch(scraper, raw_name, parse, started[adapter] + adapter.timeout)
+        except ScrapeError as e:
+            breaker.record(ok=True)  # The source answered, it just had nothing
+            return None, str(e)
+        except requests.Timeout:
+            breaker.record(ok=False)
+            return None, f"{adapter.name}: timed out"
+        except requests.ConnectionError as e:
+            breaker.record(ok=False)
+            METRICS.error(f"market.{adapter.name}", e)
+            return None, f"{adapter.name}: unreachable"
+        except Exception as e:
+            METRICS.error(f"market.{adapter.name}", e)
+            return None, f"{adapter.name}: {e}"
+        finally:
+            METRICS.observe(f"market.{adapter.name}", time.perf_counter() - start)
+        breaker.record(ok=True)
+        return offers, None
+
+    def fetch(self, scraper, raw_name, parse=None):
+        """
+        Merged result for one item: {'offers', 'sources'} where sources maps each adapter to
+        "ok" or its error, plus 'partial' when some failed. {'error'} when none returned offers.
+        """
+        merged, sources = {}, {}
+        for adapter, offers, error in self.stream(scraper, raw_name, parse):
+            sources[adapter.name] = error or "ok"
+            if offers: merge_offers(merged, offers)
+        if not merged:
+            return {"error": "\n".join(dict.fromkeys(sources.values())) or "No listings found.", "sources": sources}
+        result = {"offers": list(merged.values()), "sources": sources}
+        if any(status != "ok" for status in sources.values()): result["partial"] = True
+        return result
+
+    def close(self):
+        for pool in self._pools.values(): pool.shutdown(wait=False, cancel_futures=True)
+
+
+def merge_offers(merged, offers):
+    """Folds offers into {market: offer}; returns the offers that replaced or added a market's quote."""
+    changed = []
+    for offer in offers:
+        current = merged.get(offer['site'])
+        if current is None or (offer['ts'], -offer['price']) > (current['ts'], -current['price']):
+            merged[offer['site']] = offer
+            changed.append(offer)
+    return changed
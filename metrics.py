@@ -0,0 +1,125 @@
+"""
+Lightweight in-process instrumentation: counters, timers with latency histograms,
+cache hit rates, recent errors, JSON export and an optional cProfile hook.
+"""
+import cProfile
+import json
+import math
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+# Histogram bucket upper bounds in milliseconds
+BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000, 20000, math.inf)
+
+
+class _Timer:
+    __slots__ = ("count", "total", "min", "max", "buckets")
+
+    def __init__(self):
+        self.count, self.total, self.min, self.max = 0, 0.0, math.inf, 0.0
+        self.buckets = [0] * len(BUCKETS_MS)
+
+    def add(self, ms):
+        self.count += 1; self.total += ms
+        if ms < self.min: self.min = ms
+        if ms > self.max: self.max = ms
+        for i, bound in enumerate(BUCKETS_MS):
+            if ms <= bound: self.buckets[i] += 1; break
+
+    def percentile(self, q):
+        """Upper bound of the bucket holding the q-quantile (capped at the observed max)."""
+        rank, seen = q * self.count, 0
+        for bound, n in zip(BUCKETS_MS, self.buckets):
+            seen += n
+            if seen >= rank: return min(bound, self.max)
+        return self.max
+
+    def snapshot(self):
+        return {"count": self.count, "total_ms": round(self.total, 3),
+                "mean_ms": round(self.total / self.count, 3) if self.count else 0.0,
+                "min_ms": round(self.min, 3) if self.count else 0.0, "max_ms": round(self.max, 3),
+                "p50_ms": round(self.percentile(0.5), 3), "p95_ms": round(self.percentile(0.95), 3),
+                "histogram": {("inf" if b == math.inf else str(b)): n for b, n in zip(BUCKETS_MS, self.buckets) if n}}
+
+
+class Metrics:
+    """Thread-safe registry; every update is a dict lookup and an add under one lock."""
+    def __init__(self, max_errors=50):
+        self._lock = threading.Lock()
+        self._counters = {}
+        self._timers = {}
+        self._errors = deque(maxlen=max_errors)
+        self.started = time.time()
+
+    def incr(self, name, n=1):
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + n
+
+    def observe(self, name, seconds):
+        ms = seconds * 1000
+        with self._lock:
+            timer = self._timers.get(name)
+            if timer is None: timer = self._timers[name] = _Timer()
+            timer.add(ms)
+
+    @contextmanager
+    def timer(self, name):
+        start = time.perf_counter()
+        try: yield
+        finally: self.observe(name, time.perf_counter() - start)
+
+    def cache(self, name, hit):
+        """Counts a cache lookup; hit rates are derived in snapshot()."""
+        self.incr(f"{name}.{'hit' if hit else 'miss'}")
+
+    def error(self, source, exc):
+        """Counts and remembers a failure that would otherwise be printed or swallowed."""
+        self.incr(f"{source}.errors")
+        with self._lock:
+            self._errors.append({"ts": time.time(), "source": source, "error": f"{type(exc).__name__}: {exc}"})
+
+    def snapshot(self):
+        with self._lock:
+            counters = dict(self._counters)
+            timers = {name: t.snapshot() for name, t in self._timers.items()}
+            errors = list(self._errors)
+        rates = {}
+        for key in counters:
+            if key.endswith(".hit"):
+                name = key[:-4]
+                hits, misses = counters[key], counters.get(f"{name}.miss", 0)
+                rates[name] = round(hits / (hits + misses), 4)
+        for key in counters:
+            if key.endswith(".miss") and key[:-5] not in rates: rates[key[:-5]] = 0.0
+        return {"uptime_s": round(time.time() - self.started, 1), "counters": dict(sorted(counters.items())),
+                "timers": dict(sorted(timers.items())), "cache_hit_rates": dict(sorted(rates.items())),
+                "recent_errors": errors}
+
+    def to_json(self, path=None):
+        data = json.dumps(self.snapshot(), indent=2)
+        if path:
+            with open(path, "w", encoding="utf-8") as f: f.write(data)
+        return data
+
+    def reset(self):
+        with self._lock:
+            self._counters.clear(); self._timers.clear(); self._errors.clear()
+            self.started = time.time()
+
+
+METRICS = Metrics()
+
+
+@contextmanager
+def profiling(path=None):
+    """Runs the block under cProfile; stats are dumped to `path` (no-op when path is falsy)."""
+    if not path:
+        yield None; return
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try: yield profiler
+    finally:
+        profiler.disable()
+        profiler.dump_stats(path)
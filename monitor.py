@@ -0,0 +1,180 @@
+"""
+Price alerts for background monitoring: per-item rules evaluated incrementally against
+the last known offers, and a poll schedule that revisits items near a trigger sooner.
+"""
+import heapq
+import json
+import time
+from config import MARKET_FEES, MONITOR_MIN_INTERVAL, MONITOR_MAX_INTERVAL, MONITOR_NEAR_GAP
+from metrics import METRICS
+
+
+class AlertRule:
+    """
+    Thresholds for one item. A market triggers when its ask is at or under `max_buy`, or
+    when buying there clears `min_profit_pct` after fees: selling at `sell_price` minus
+    `fee` percent, or (without sell_price) relisting on the best other market after its fee.
+    """
+    def __init__(self, item, max_buy=None, min_profit_pct=None, sell_price=None, fee=0.0):
+        self.item = item
+        self.max_buy = max_buy
+        self.min_profit_pct = min_profit_pct
+        self.sell_price = sell_price
+        self.fee = fee or 0.0
+
+    @classmethod
+    def from_dict(cls, data):
+        """Builds a rule from its JSON object; raises ValueError for a missing item or a non-numeric threshold."""
+        if not isinstance(data, dict): raise ValueError(f"rule is not an object: {data!r}")
+        item = str(data.get('item') or "").strip()
+        if not item: raise ValueError(f"rule without an item: {data!r}")
+        return cls(item, _number(data, 'max_buy'), _number(data, 'min_profit_pct'),
+                   _number(data, 'sell_price'), _number(data, 'fee'))
+
+    @property
+    def relist(self):
+        return self.min_profit_pct is not None and not self.sell_price
+
+
+def _number(data, key):
+    value = data.get(key)
+    if value is None: return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"{data.get('item')}: {key} must be a number, not {value!r}") from None
+
+
+def load_rules(path):
+    """
+    Reads a JSON list of rule objects ({"item": ..., "max_buy": ..., ...}). Entries without
+    an item are skipped; any other malformed entry raises ValueError.
+    """
+    with open(path, encoding="utf-8") as f:
+        entries = json.load(f)
+    if not isinstance(entries, list): raise ValueError("expected a JSON list of rules")
+    return [AlertRule.from_dict(d) for d in entries if not isinstance(d, dict) or d.get('item')]
+
+
+class AlertEngine:
+    """
+    Keeps the last ask per item x market cell. update() diffs a new offer set against it
+    and evaluates the item's rule only for cells whose price changed (every cell of the
+    item when its best relisting market changed). Alerts are edge-triggered: a cell fires
+    once when it starts matching and again only after it has stopped matching.
+    """
+    def __init__(self, rules, fees=None):
+        self.rules = {r.item: r for r in rules}
+        self.fees = MARKET_FEES if fees is None else fees
+        self.cells = {}       # item -> {market: price}
+        self.gaps = {}        # item -> {market: relative price drop still needed to trigger}
+        self.best_sell = {}   # item -> top two (net, market) relisting quotes
+        self.active = set()   # (item, market, kind) currently triggered
+
+    def update(self, item, offers, ts=None):
+        """Applies a new offer set for `item`; returns the alerts that just fired."""
+        prices = {}
+        for o in offers:
+            if o['site'] not in prices or o['price'] < prices[o['site']]: prices[o['site']] = o['price']
+        old = self.cells.get(item, {})
+        self.cells[item] = prices
+        changed = {m for m, p in prices.items() if old.get(m) != p}
+        removed = old.keys() - prices.keys()
+        METRICS.incr("monitor.cells_changed", len(changed) + len(removed))
+
+        rule = self.rules.get(item)
+        if rule is None: return []
+        gaps = self.gaps.setdefault(item, {})
+        for market in removed:
+            gaps.pop(market, None)
+            self.active -= {(item, market, kind) for kind in ("buy", "profit")}
+
+        if rule.relist:
+            best = sorted(((p * (1 - self.fees.get(m, 0.0) / 100), m) for m, p in prices.items()), reverse=True)[:2]
+            if best != self.best_sell.get(item): changed = set(prices)
+            self.best_sell[item] = best
+
+        alerts = []
+        ts = ts or time.time()
+        for market in changed:
+            price = prices[market]
+            thresholds = self._thresholds(rule, market)
+            gaps[market] = min((max(0.0, (price - t) / t) for _, t, _ in thresholds if t > 0), default=None)
+            for kind, threshold, sell_net in thresholds:
+                key = (item, market, kind)
+                if price <= threshold:
+                    if key in self.active: continue
+                    self.active.add(key)
+                    alerts.append(self._alert(rule, market, kind, price, threshold, sell_net, ts))
+                else:
+                    self.active.discard(key)
+        METRICS.incr("monitor.cells_evaluated", len(changed))
+        METRICS.incr("monitor.alerts", len(alerts))
+        return alerts
+
+    def _thresholds(self, rule, market):
+        """[(kind, trigger price, sell net or None)] for one cell of `rule`'s item."""
+        out = []
+        if rule.max_buy is not None: out.append(("buy", rule.max_buy, None))
+        if rule.min_profit_pct is not None:
+            if rule.relist:
+                net = next((n for n, m in self.best_sell.get(rule.item, ()) if m != market), None)
+            else:
+                net = rule.sell_price * (1 - rule.fee / 100)
+            if net is not None: out.append(("profit", net / (1 + rule.min_profit_pct / 100), net))
+        return out
+
+    def _alert(self, rule, market, kind, price, threshold, sell_net, ts):
+        alert = {'item': rule.item, 'market': market, 'kind': kind, 'price': price,
+                 'threshold': round(threshold, 2), 'ts': ts}
+        if kind == "buy":
+            alert['message'] = f"{rule.item}: ${price:.2f} on {market} (at or under ${rule.max_buy:.2f})"
+        else:
+            alert['profit_pct'] = round((sell_net - price) / price * 100, 2)
+            alert['message'] = (f"{rule.item}: buy ${price:.2f} on {market}, "
+                                f"+{alert['profit_pct']:.1f}% after fees (net ${sell_net:.2f})")
+        return alert
+
+    def gap(self, item):
+        """Smallest relative price drop that would trigger any of the item's cells; None if unknown."""
+        values = [g for g in self.gaps.get(item, {}).values() if g is not None]
+        return min(values) if values else None
+
+
+class PollSchedule:
+    """
+    Min-heap of (due time, item). After each poll an item is rescheduled between
+    min_interval (at or near a trigger, or not seen yet) and max_interval (far from one).
+    """
+    def __init__(self, engine, items, min_interval=MONITOR_MIN_INTERVAL, max_interval=MONITOR_MAX_INTERVAL,
+                 near_gap=MONITOR_NEAR_GAP):
+        self.engine = engine
+        self.min_interval, self.max_interval, self.near_gap = min_interval, max_interval, near_gap
+        now = time.time()
+        self._heap = [(now, i, item) for i, item in enumerate(dict.fromkeys(items))]
+        heapq.heapify(self._heap)
+        self._seq = len(self._heap)
+
+    def __len__(self):
+        return len(self._heap)
+
+    def interval(self, item):
+        gap = self.engine.gap(item)
+        if gap is None: return self.min_interval
+        return self.min_interval + (self.max_interval - self.min_interval) * min(1.0, gap / self.near_gap)
+
+    def due(self, now=None):
+        """Pops every item whose poll is due."""
+        now = time.time() if now is None else now
+        items = []
+        while self._heap and self._heap[0][0] <= now:
+            items.append(heapq.heappop(self._heap)[2])
+        return items
+
+    def reschedule(self, item, now=None):
+        now = time.time() if now is None else now
+        self._seq += 1
+        heapq.heappush(self._heap, (now + self.interval(item), self._seq, item))
+
+    def next_due(self):
+        return self._heap[0][0] if self._heap else None
@@ -0,0 +1,115 @@
+"""
+Asyncio network core: one event loop thread with pooled connections, bridged to Qt signals.
+Uses aiohttp when it is installed, otherwise a shared requests.Session in a bounded executor.
+"""
+import asyncio
+import importlib.util
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+from PyQt5.QtCore import QObject, pyqtSignal
+from config import NET_MAX_CONNECTIONS, NET_MAX_CONNECTIONS_PER_HOST, NET_FALLBACK_WORKERS
+from metrics import METRICS
+
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64)'
+# The HTTP client itself is imported on first use, off the GUI thread
+NET_BACKEND = "aiohttp" if importlib.util.find_spec("aiohttp") is not None else "requests"
+
+Response = namedtuple("Response", "status headers content")
+
+
+class NetworkCore(QObject):
+    """
+    Owns the event loop thread. submit() schedules a coroutine from any thread and can
+    hand its outcome to a callback on the GUI thread; run() blocks a worker thread on one.
+    Blocking work (cloudscraper sessions, disk, image decoding) goes through run_blocking.
+    """
+    _done = pyqtSignal(object, object, object)  # callback, result, error
+
+    def __init__(self, max_connections=NET_MAX_CONNECTIONS, per_host=NET_MAX_CONNECTIONS_PER_HOST,
+                 fallback_workers=NET_FALLBACK_WORKERS):
+        super().__init__()
+        self._done.connect(self._deliver)
+        self.max_connections, self.per_host = max_connections, per_host
+        self._executor = ThreadPoolExecutor(max_workers=fallback_workers, thread_name_prefix="net")
+        self._aiohttp = None   # Sessions are created on first use
+        self._session = None
+        self._session_lock = threading.Lock()
+
+        self.loop = asyncio.new_event_loop()
+        self.loop.set_default_executor(self._executor)
+        self._thread = threading.Thread(target=self.loop.run_forever, name="net-loop", daemon=True)
+        self._thread.start()
+
+    # --- Scheduling ---
+    def submit(self, coro, callback=None):
+        """
+        Schedules `coro` on the loop and returns its concurrent Future (cancel() aborts it).
+        callback(result, error) runs on the GUI thread unless the future was cancelled.
+        """
+        future = asyncio.run_coroutine_threadsafe(coro, self.loop)
+        if callback is not None:
+            def done(f):
+                if f.cancelled(): return
+                error = f.exception()
+                self._done.emit(callback, None if error else f.result(), error)
+            future.add_done_callback(done)
+        return future
+
+    def run(self, coro, timeout=None):
+        """Blocks the calling (non-loop) thread until `coro` finishes and returns its result."""
+        return self.submit(coro).result(timeout)
+
+    def _deliver(self, callback, result, error):
+        callback(result, error)
+
+    async def run_blocking(self, fn, *args):
+        """Awaits fn(*args) on the core's bounded executor."""
+        return await self.loop.run_in_executor(None, fn, *args)
+
+    # --- Requests ---
+    async def get(self, url, headers=None, timeout=10):
+        """GETs `url` over the pooled connections; returns Response(status, headers, content)."""
+        start = time.perf_counter()
+        try:
+            if NET_BACKEND == "aiohttp":
+                import aiohttp
+                session = self._aiohttp_session()
+                async with session.get(url, headers=headers, timeout=aiohttp.ClientTimeout(total=timeout)) as resp:
+                    return Response(resp.status, resp.headers, await resp.read())
+            resp = await self.run_blocking(lambda: self._requests_session().get(url, headers=headers, timeout=timeout))
+            return Response(resp.status_code, resp.headers, resp.content)
+        finally:
+            METRICS.observe(f"net.get.{NET_BACKEND}", time.perf_counter() - start)
+
+    def _aiohttp_session(self):
+        import aiohttp
+        if self._aiohttp is None:
+            connector = aiohttp.TCPConnector(limit=self.max_connections, limit_per_host=self.per_host)
+            self._aiohttp = aiohttp.ClientSession(connector=connector, headers={'User-Agent': USER_AGENT})
+        return self._aiohttp
+
+    def _requests_session(self):
+        with self._session_lock:
+            if self._session is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+                self._session = requests.Session()
+                self._session.headers['User-Agent'] = USER_AGENT
+                adapter = HTTPAdapter(pool_connections=4, pool_maxsize=self.per_host)
+                self._session.mount('https://', adapter); self._session.mount('http://', adapter)
+            return self._session
+
+    def close(self):
+        """Closes the connection pools and stops the loop thread."""
+        async def shutdown():
+            if self._aiohttp is not None: await self._aiohttp.close()
+        if self.loop.is_running():
+            try: self.run(shutdown(), timeout=5)
+            except Exception as e: METRICS.error("net", e)
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self._thread.join(timeout=5)
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        if self._session is not None: self._session.close()
@@ -0,0 +1,115 @@
+"""
+TTL cache of parsed scan results, keyed by the csgoskins.gg item slug.
+"""
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from config import OFFER_CACHE_TTL, OFFER_CACHE_STALE_TTL, OFFER_CACHE_SIZE, OFFER_CACHE_SAVE_DELAY
+from metrics import METRICS
+
+
+class OfferCache:
+    """
+    Bounded LRU of {key: (stored_at, result)}. Entries younger than `ttl` are fresh,
+    entries up to `stale_ttl` may still be served while the caller revalidates them,
+    older ones are dropped. With a `path` the cache is persisted as JSON at most once per
+    `save_delay` seconds after an update (a batch scan means one write, not one per item),
+    and on close().
+    """
+    def __init__(self, ttl=OFFER_CACHE_TTL, stale_ttl=OFFER_CACHE_STALE_TTL, max_entries=OFFER_CACHE_SIZE, path=None,
+                 save_delay=OFFER_CACHE_SAVE_DELAY):
+        self.ttl = ttl
+        self.stale_ttl = max(stale_ttl, ttl)
+        self.max_entries = max_entries
+        self.path = path
+        self.save_delay = save_delay
+        self._lock = threading.Lock()
+        self._save_lock = threading.Lock()  # Orders writes; never held by get()/put()
+        self._entries = OrderedDict()
+        self._dirty = False
+        self._timer = None
+        if path: self._load()
+
+    def get(self, key):
+        """Returns (result, age_seconds, is_fresh), or None if missing or too old to serve."""
+        with self._lock:
+            entry = self._entries.get(key)
+            age = time.time() - entry[0] if entry is not None else None
+            if entry is not None and age > self.stale_ttl:
+                del self._entries[key]; entry = None
+            if entry is not None: self._entries.move_to_end(key)
+        METRICS.cache("offer_cache", entry is not None and age < self.ttl)
+        if entry is None: return None
+        return entry[1], age, age < self.ttl
+
+    def put(self, key, result, fresh=True):
+        """Stores `result`; fresh=False stores it already past its TTL, to be served only as stale."""
+        stored_at = time.time() if fresh else time.time() - self.ttl
+        with self._lock:
+            self._entries[key] = (stored_at, result)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            self._schedule_save()
+
+    def invalidate(self, key=None):
+        with self._lock:
+            if key is None: self._entries.clear()
+            else: self._entries.pop(key, None)
+            self._schedule_save()
+
+    def _schedule_save(self):
+        """Marks the cache dirty and arms the save timer (caller holds _lock)."""
+        if not self.path: return
+        self._dirty = True
+        if self._timer is None:
+            self._timer = threading.Timer(self.save_delay, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def flush(self):
+        """Writes pending changes to disk now."""
+        with self._save_lock:
+            with self._lock:
+                if self._timer is not None: self._timer.cancel(); self._timer = None
+                if not self._dirty: return
+                self._dirty = False
+                entries = [[k, ts, res] for k, (ts, res) in self._entries.items()]
+            self._save(entries)
+
+    def close(self):
+        self.flush()
+
+    def _load(self):
+        """Restores the saved entries; a file that is unreadable or not in the saved layout counts as empty."""
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                entries = json.load(f)
+        except (OSError, ValueError):
+            return
+        if not isinstance(entries, list) or not all(_valid_entry(e) for e in entries):
+            METRICS.incr("offer_cache.corrupt")
+            print(f"OfferCache Error: {self.path} is not a saved cache, ignored")
+            return
+        cutoff = time.time() - self.stale_ttl
+        for key, stored_at, result in entries[-self.max_entries:]:
+            if stored_at >= cutoff: self._entries[key] = (stored_at, result)
+
+    def _save(self, entries):
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            tmp = f"{self.path}.tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(entries, f)
+            os.replace(tmp, self.path)
+        except OSError as e:
+            print(f"OfferCache Error: {e}")
+
+
+def _valid_entry(entry):
+    """[key, stored_at, result] as flush() writes it, result being a scan result with an offer list."""
+    return (isinstance(entry, list) and len(entry) == 3 and isinstance(entry[0], str)
+            and isinstance(entry[1], (int, float)) and not isinstance(entry[1], bool)
+            and isinstance(entry[2], dict) and isinstance(entry[2].get("offers"), list))
@@ -0,0 +1,57 @@
+"""
+Out-of-process parse stage: raw page bytes go to a pool of parser processes and only
+the compact offers list comes back, so batch scans are not serialized on the GIL.
+"""
+import multiprocessing
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, TimeoutError
+from concurrent.futures.process import BrokenProcessPool
+
+from config import PARSE_PROCESSES, PARSE_TIMEOUT
+from extractor import parse_offers
+from metrics import METRICS
+
+
+class ParsePool:
+    """
+    Lazily started ProcessPoolExecutor running parse_offers; processes=1 parses in the calling thread.
+    Workers are spawned rather than forked: the pool starts while the net loop, autocomplete
+    and warm-up threads run, and a forked child can inherit a lock one of them was holding.
+    """
+    def __init__(self, processes=PARSE_PROCESSES, timeout=PARSE_TIMEOUT):
+        self.processes = max(1, processes)
+        self.timeout = timeout
+        self._executor = None
+        self._lock = threading.Lock()
+
+    def _pool(self):
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=self.processes,
+                                                     mp_context=multiprocessing.get_context("spawn"))
+            return self._executor
+
+    def parse(self, content):
+        """
+        Returns the offers parsed from `content`, falling back to in-thread parsing if the
+        pool breaks or a worker does not answer within `timeout` (the pool is then replaced).
+        """
+        if self.processes == 1: return parse_offers(content)
+        start = time.perf_counter()
+        pool = self._pool()
+        try:
+            offers = pool.submit(parse_offers, content).result(self.timeout)
+        except (BrokenProcessPool, TimeoutError) as e:
+            METRICS.error("parse_pool", e)
+            with self._lock:
+                if self._executor is pool: self._executor = None
+            pool.shutdown(wait=False, cancel_futures=True)
+            return parse_offers(content)
+        METRICS.observe("parse_pool.roundtrip", time.perf_counter() - start)
+        return offers
+
+    def close(self):
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None: executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,66 @@
+"""
+Local price history: every successful scan is appended to a SQLite (WAL) store.
+"""
+import os
+import sqlite3
+import threading
+import time
+from config import PRICE_HISTORY_PATH
+
+
+class PriceHistory:
+    """Append-only table of (ts, item, market, price) indexed by item, market and time."""
+    def __init__(self, path=PRICE_HISTORY_PATH):
+        if path != ":memory:": os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("CREATE TABLE IF NOT EXISTS prices (ts REAL NOT NULL, item TEXT NOT NULL, "
+                           "market TEXT NOT NULL, price REAL NOT NULL)")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_prices_item_market_ts ON prices (item, market, ts)")
+
+    def record(self, item, offers, ts=None):
+        """Appends one scan's offers in a single transaction."""
+        self.record_many([(item, offers, ts)])
+
+    def record_many(self, scans):
+        """Appends many (item, offers, ts) scans in a single transaction; ts defaults to now."""
+        now = time.time()
+        rows = [(ts or now, item, o['site'], o['price']) for item, offers, ts in scans for o in offers]
+        if not rows: return
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.executemany("INSERT INTO prices VALUES (?, ?, ?, ?)", rows)
+                self._conn.execute("COMMIT")
+            except sqlite3.Error:
+                self._conn.execute("ROLLBACK"); raise
+
+    def latest(self, item):
+        """Returns {market: (price, ts)} with the most recent quote per market."""
+        with self._lock:
+            rows = self._conn.execute("SELECT market, price, MAX(ts) FROM prices WHERE item = ? GROUP BY market",
+                                      (item,)).fetchall()
+        return {market: (price, ts) for market, price, ts in rows}
+
+    def stats(self, item, since=None, until=None):
+        """Returns {market: {'min', 'avg', 'max', 'count'}} over the [since, until] time window."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT market, MIN(price), AVG(price), MAX(price), COUNT(*) FROM prices "
+                "WHERE item = ? AND ts >= ? AND ts <= ? GROUP BY market",
+                (item, since if since is not None else 0.0, until if until is not None else float("inf"))).fetchall()
+        return {m: {'min': lo, 'avg': avg, 'max': hi, 'count': n} for m, lo, avg, hi, n in rows}
+
+    def history(self, item, market, since=None, until=None):
+        """Returns [(ts, price), ...] for one item on one market, oldest first."""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT ts, price FROM prices WHERE item = ? AND market = ? AND ts >= ? AND ts <= ? ORDER BY ts",
+                (item, market, since if since is not None else 0.0,
+                 until if until is not None else float("inf"))).fetchall()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,214 @@
+"""
+Request scheduling for the scraper: per-host token buckets, adaptive concurrency,
+retries with exponential backoff, jitter and Retry-After support, optional per-call
+deadlines, and a circuit breaker for dependencies that keep timing out.
+"""
+import random
+import threading
+import time
+from collections import deque
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlsplit
+
+import requests
+from config import (REQUESTS_PER_SECOND, REQUEST_BURST, MAX_RETRIES, BACKOFF_BASE, BACKOFF_MAX,
+                    SCAN_CONCURRENCY)
+from metrics import METRICS
+
+RETRY_STATUSES = frozenset((429, 500, 502, 503, 504))
+THROTTLE_STATUSES = frozenset((429, 503))
+
+
+class TokenBucket:
+    """Classic token bucket; acquire() blocks until a token is available. rate=None disables it."""
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.burst = max(1.0, float(burst))
+        self.tokens = self.burst
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, timeout=None):
+        """Returns the seconds waited for a token, or None if none is due within `timeout`."""
+        if not self.rate: return 0.0
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1; return waited
+                delay = (1 - self.tokens) / self.rate
+            if timeout is not None and waited + delay > timeout: return None
+            time.sleep(delay); waited += delay
+
+
+class AdaptiveLimiter:
+    """
+    AIMD concurrency limit: every clean response nudges the limit up by 1/limit, and when
+    the error rate over the last `window` responses exceeds `threshold` the limit halves.
+    """
+    def __init__(self, max_limit, min_limit=1, window=20, threshold=0.2):
+        self.max_limit = max(1, max_limit)
+        self.min_limit = max(1, min(min_limit, self.max_limit))
+        self.limit = float(self.max_limit)
+        self.threshold = threshold
+        self.outcomes = deque(maxlen=window)
+        self.active = 0
+        self._cond = threading.Condition()
+
+    def acquire(self, timeout=None):
+        """Takes a slot; False if none freed up within `timeout` seconds."""
+        with self._cond:
+            if not self._cond.wait_for(lambda: self.active < int(self.limit), timeout): return False
+            self.active += 1
+            return True
+
+    def release(self, ok):
+        with self._cond:
+            self.active -= 1
+            self.outcomes.append(ok)
+            errors = self.outcomes.count(False)
+            if not ok and len(self.outcomes) >= 5 and errors / len(self.outcomes) > self.threshold:
+                self.limit = max(self.min_limit, self.limit / 2)
+                self.outcomes.clear()
+                METRICS.incr("scheduler.concurrency_decrease")
+            elif ok:
+                self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+            self._cond.notify_all()
+
+
+def retry_after_seconds(response):
+    """Parses a Retry-After header (delta-seconds or HTTP-date); None if absent or invalid."""
+    value = response.headers.get("Retry-After")
+    if not value: return None
+    try: return max(0.0, float(value))
+    except ValueError: pass
+    try: return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError): return None
+
+
+class _HostState:
+    def __init__(self, rate, burst, max_concurrency):
+        self.bucket = TokenBucket(rate, burst)
+        self.limiter = AdaptiveLimiter(max_concurrency)
+        self.cooldown_until = 0.0
+
+
+class RequestScheduler:
+    """Runs request callables under per-host pacing, adaptive concurrency and retry policy."""
+    def __init__(self, rate=REQUESTS_PER_SECOND, burst=REQUEST_BURST, max_retries=MAX_RETRIES,
+                 backoff_base=BACKOFF_BASE, backoff_max=BACKOFF_MAX, max_concurrency=SCAN_CONCURRENCY):
+        self.rate, self.burst = rate, burst
+        self.max_retries = max_retries
+        self.backoff_base, self.backoff_max = backoff_base, backoff_max
+        self.max_concurrency = max_concurrency
+        self._hosts = {}
+        self._lock = threading.Lock()
+
+    def host_state(self, host):
+        with self._lock:
+            state = self._hosts.get(host)
+            if state is None:
+                state = self._hosts[host] = _HostState(self.rate, self.burst, self.max_concurrency)
+            return state
+
+    def backoff(self, attempt):
+        """Full-jitter exponential backoff for the given retry attempt (0-based)."""
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+    def request(self, url, send, deadline=None, retries=None):
+        """
+        Calls send() for `url`, retrying 429/5xx and connection errors; returns the last response.
+        `retries` overrides max_retries. With a `deadline` (a time.monotonic() value) no pause,
+        slot wait or backoff runs past it: waits that cannot fit raise DeadlineExceeded, and a
+        retry that cannot fit ends the call with the response or error at hand.
+        """
+        host = urlsplit(url).netloc
+        state = self.host_state(host)
+        max_retries = self.max_retries if retries is None else retries
+        for attempt in range(max_retries + 1):
+            # A throttled host pauses every worker, not just the one that got the 429
+            pause = state.cooldown_until - time.monotonic()
+            if pause > 0:
+                if not _fits(pause, deadline): raise DeadlineExceeded(f"{host}: throttled past the deadline")
+                time.sleep(pause)
+            waited = state.bucket.acquire(time_left(deadline))
+            if waited is None: raise DeadlineExceeded(f"{host}: no request token before the deadline")
+            METRICS.observe("scheduler.token_wait", waited)
+
+            if not state.limiter.acquire(time_left(deadline)):
+                METRICS.incr("scheduler.slot_timeout")
+                raise DeadlineExceeded(f"{host}: no free request slot before the deadline")
+            response = delay = None
+            try:
+                response = send()
+            except (requests.ConnectionError, requests.Timeout) as e:
+                delay = self.backoff(attempt)
+                if attempt == max_retries or not _fits(delay, deadline): raise
+                METRICS.incr("scheduler.retries")
+                METRICS.error("scheduler", e)
+            finally:
+                # Any other exception (e.g. a Cloudflare challenge error) still frees the slot, as a failure
+                state.limiter.release(ok=response is not None and response.status_code not in RETRY_STATUSES)
+            if response is None:
+                time.sleep(delay); continue
+
+            status = response.status_code
+            if status not in RETRY_STATUSES or attempt == max_retries:
+                return response
+
+            delay = retry_after_seconds(response)
+            if delay is None: delay = self.backoff(attempt)
+            delay = min(delay, self.backoff_max)
+            if not _fits(delay, deadline): return response
+            response.close()  # A streamed response would otherwise keep its pooled connection
+            if status in THROTTLE_STATUSES:
+                METRICS.incr("scheduler.throttled")
+                state.cooldown_until = max(state.cooldown_until, time.monotonic() + delay)
+            METRICS.incr("scheduler.retries")
+            time.sleep(delay)
+
+
+class DeadlineExceeded(requests.Timeout):
+    """A scheduled request could not be started, or retried, before its deadline."""
+
+
+def time_left(deadline, cap=None):
+    """Seconds until a time.monotonic() deadline (0 once it passed), at most `cap`; `cap` without one."""
+    if deadline is None: return cap
+    left = max(0.0, deadline - time.monotonic())
+    return left if cap is None else min(cap, left)
+
+
+def _fits(delay, deadline):
+    return deadline is None or time.monotonic() + delay < deadline
+
+
+class CircuitBreaker:
+    """
+    Stops calls to a dependency for `cooldown` seconds once `threshold` calls in a row failed.
+    After the cooldown a single trial call is let through; its outcome closes the breaker
+    or opens it for another cooldown.
+    """
+    def __init__(self, threshold, cooldown):
+        self.threshold, self.cooldown = threshold, cooldown
+        self.failures = 0
+        self.open_until = 0.0
+        self._lock = threading.Lock()
+
+    def allow(self):
+        with self._lock:
+            now = time.monotonic()
+            if now < self.open_until: return False
+            if self.failures >= self.threshold: self.open_until = now + self.cooldown  # Holds others off the trial
+            return True
+
+    def record(self, ok):
+        with self._lock:
+            if ok:
+                self.failures, self.open_until = 0, 0.0
+                return
+            self.failures += 1
+            if self.failures >= self.threshold: self.open_until = time.monotonic() + self.cooldown
@@ -0,0 +1,268 @@
+"""
+Model/view results panel: offers live in a table model and rows are painted on demand.
+"""
+import math
+from bisect import bisect_right
+from PyQt5.QtWidgets import QTableView, QStyledItemDelegate, QHeaderView, QAbstractItemView
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex, QRect
+from PyQt5.QtGui import QColor, QFont
+
+COL_RANK, COL_ITEM, COL_MARKET, COL_PRICE, COL_PROFIT = range(5)
+COLUMNS = ["#", "ITEM", "MARKET", "PRICE", "PROFIT / LOSS"]
+ROW_ROLE = Qt.UserRole + 1
+ROW_HEIGHT = 46
+
+
+def offer_row(item, offer, fetched):
+    """Table row for one offer, stamped with the quote's own 'ts' or else `fetched`, when it was scanned."""
+    return {'item': item, 'site': offer['site'], 'price': offer['price'], 'ts': offer.get('ts', fetched)}
+
+
+def profit_text(profit):
+    """Returns (text, color) for a profit value, matching the banner wording."""
+    if profit > 0: return f"+${profit:.2f} Profit", "#00E676"
+    if profit < 0: return f"-${abs(profit):.2f} Loss", "#FF5555"
+    return "$0.00 Break Even", "#9E9E9E"
+
+
+class OfferTableModel(QAbstractTableModel):
+    """
+    Rows are dicts {'item', 'site', 'price', 'ts'} (or 'error' for failed items), keyed by
+    (item, site). set_rows/set_item_rows diff against the current rows so only changed
+    rows are repainted; sorting is done here rather than through a proxy model.
+    """
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+        self._best = set()
+        self.net_income = 0.0
+        self._sort_column = COL_PRICE
+        self._sort_order = Qt.AscendingOrder
+
+    # --- Qt model interface ---
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(COLUMNS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole: return COLUMNS[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid(): return None
+        row = self._rows[index.row()]
+        if role == ROW_ROLE: return row
+        if role == Qt.DisplayRole: return self.display_text(index.row(), index.column())[0]
+        return None
+
+    def display_text(self, r, column):
+        """Returns (text, color) for one cell; shared by data() and the delegate."""
+        row = self._rows[r]
+        is_best = self._key(row) in self._best
+        if column == COL_RANK: return f"#{r + 1}", "#757575"
+        if column == COL_ITEM: return row['item'], "white"
+        if column == COL_MARKET:
+            if 'error' in row: return f"⚠️ {row['error'].splitlines()[0]}", "#FF5555"
+            return row['site'], "#00E676" if is_best else "white"
+        if column == COL_PRICE:
+            return ("" if 'error' in row else f"${row['price']:.2f}"), "#FFB74D"
+        if column == COL_PROFIT:
+            profit = self.profit(row)
+            return profit_text(profit) if profit is not None else ("", "#9E9E9E")
+        return "", "white"
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        self._sort_column, self._sort_order = column, order
+        self._resort()
+
+    # --- Updates ---
+    @staticmethod
+    def _key(row):
+        return row['item'], row.get('site')
+
+    def profit(self, row):
+        if self.net_income <= 0 or 'error' in row: return None
+        return self.net_income - row['price']
+
+    def row(self, r):
+        return self._rows[r]
+
+    def rows(self):
+        return list(self._rows)
+
+    def set_net_income(self, net_income):
+        if net_income == self.net_income: return
+        self.net_income = net_income
+        if self._rows:
+            self.dataChanged.emit(self.index(0, COL_PROFIT), self.index(len(self._rows) - 1, COL_PROFIT))
+            if self._sort_column == COL_PROFIT: self._resort()
+
+    def upsert_row(self, row):
+        """Updates one row in place or inserts it at its sorted position (for streamed offers)."""
+        key = self._key(row)
+        for i, existing in enumerate(self._rows):
+            if self._key(existing) == key:
+                if existing != row:
+                    self._rows[i] = row
+                    self.dataChanged.emit(self.index(i, 0), self.index(i, len(COLUMNS) - 1))
+                    self._refresh_best(); self._resort()
+                return
+
+        keys = [self._sort_key(r) for r in self._rows]
+        new_key = self._sort_key(row)
+        if self._sort_order == Qt.DescendingOrder:
+            pos = next((i for i, k in enumerate(keys) if k < new_key), len(keys))
+        else:
+            pos = bisect_right(keys, new_key)
+        self.beginInsertRows(QModelIndex(), pos, pos)
+        self._rows.insert(pos, row)
+        self.endInsertRows()
+        self._refresh_best()
+        if pos < len(self._rows) - 1:
+            self.dataChanged.emit(self.index(pos, COL_RANK), self.index(len(self._rows) - 1, COL_RANK))
+
+    def set_item_rows(self, item, rows):
+        """Replaces the rows of one item, leaving every other item untouched."""
+        self.set_rows([r for r in self._rows if r['item'] != item] + list(rows))
+
+    def set_rows(self, rows):
+        """Diffs `rows` against the model: removes, updates and appends only what changed."""
+        new = {self._key(r): r for r in rows}
+
+        # Remove vanished rows in contiguous runs, bottom-up
+        r = len(self._rows) - 1
+        while r >= 0:
+            if self._key(self._rows[r]) in new: r -= 1; continue
+            end = r
+            while r >= 0 and self._key(self._rows[r]) not in new: r -= 1
+            self.beginRemoveRows(QModelIndex(), r + 1, end)
+            del self._rows[r + 1:end + 1]
+            self.endRemoveRows()
+
+        position = {self._key(row): i for i, row in enumerate(self._rows)}
+        last_col = len(COLUMNS) - 1
+        for key, row in new.items():
+            i = position.get(key)
+            if i is not None and self._rows[i] != row:
+                self._rows[i] = row
+                self.dataChanged.emit(self.index(i, 0), self.index(i, last_col))
+
+        added = [row for key, row in new.items() if key not in position]
+        if added:
+            start = len(self._rows)
+            self.beginInsertRows(QModelIndex(), start, start + len(added) - 1)
+            self._rows.extend(added)
+            self.endInsertRows()
+
+        self._refresh_best()
+        self._resort()
+
+    def _refresh_best(self):
+        cheapest = {}
+        for row in self._rows:
+            if 'error' in row: continue
+            best = cheapest.get(row['item'])
+            if best is None or row['price'] < best['price']: cheapest[row['item']] = row
+        best = {self._key(row) for row in cheapest.values()}
+        if best != self._best:
+            self._best = best
+            if self._rows:
+                self.dataChanged.emit(self.index(0, COL_MARKET), self.index(len(self._rows) - 1, COL_MARKET))
+
+    def _sort_key(self, row):
+        missing = math.inf if self._sort_order == Qt.AscendingOrder else -math.inf
+        if self._sort_column == COL_ITEM: return (row['item'].lower(), row.get('price', missing))
+        if self._sort_column == COL_MARKET: return (row.get('site') or "").lower()
+        if self._sort_column == COL_PROFIT:
+            profit = self.profit(row)
+            return missing if profit is None else profit
+        return row.get('price', missing)
+
+    def _resort(self):
+        if len(self._rows) < 2: return
+        order = sorted(range(len(self._rows)), key=lambda i: self._sort_key(self._rows[i]),
+                       reverse=self._sort_order == Qt.DescendingOrder)
+        if order == list(range(len(order))): return
+
+        self.layoutAboutToBeChanged.emit()
+        old_to_new = {old: new for new, old in enumerate(order)}
+        persistent = self.persistentIndexList()
+        self._rows = [self._rows[i] for i in order]
+        self.changePersistentIndexList(persistent, [self.index(old_to_new[p.row()], p.column()) for p in persistent])
+        self.layoutChanged.emit()
+        # Rank labels follow row positions
+        self.dataChanged.emit(self.index(0, COL_RANK), self.index(len(self._rows) - 1, COL_RANK))
+
+
+class OfferDelegate(QStyledItemDelegate):
+    """Paints each row as a dark card strip, using the same palette as the old result cards."""
+    CARD_COLOR = QColor("#1E1E24")
+    BORDER_COLOR = QColor("#2C2C34")
+
+    def paint(self, painter, option, index):
+        model = index.model()
+        text, color = model.display_text(index.row(), index.column())
+        rect = option.rect.adjusted(0, 3, 0, -3)
+
+        painter.save()
+        painter.setPen(Qt.NoPen)
+        painter.fillRect(rect, self.CARD_COLOR)
+        painter.setPen(self.BORDER_COLOR)
+        painter.drawLine(rect.topLeft(), rect.topRight())
+        painter.drawLine(rect.bottomLeft(), rect.bottomRight())
+
+        font = QFont(option.font)
+        column = index.column()
+        font.setBold(column != COL_RANK)
+        font.setPixelSize({COL_PRICE: 18, COL_PROFIT: 13}.get(column, 16 if column != COL_ITEM else 14))
+        if column == COL_PRICE: font.setWeight(QFont.Black)
+        painter.setFont(font)
+        painter.setPen(QColor(color))
+
+        align = Qt.AlignVCenter | (Qt.AlignRight if column in (COL_PRICE, COL_PROFIT) else Qt.AlignLeft)
+        text_rect = QRect(rect.adjusted(14, 0, -14, 0))
+        painter.drawText(text_rect, align, painter.fontMetrics().elidedText(text, Qt.ElideRight, text_rect.width()))
+        painter.restore()
+
+    def sizeHint(self, option, index):
+        size = super().sizeHint(option, index)
+        size.setHeight(ROW_HEIGHT)
+        return size
+
+
+class ResultsView(QTableView):
+    """Table view configured for the offer model: no grid, fixed rows, sortable header."""
+    def __init__(self, model, parent=None):
+        super().__init__(parent)
+        self.setModel(model)
+        self.setItemDelegate(OfferDelegate(self))
+        self.setShowGrid(False)
+        self.setSortingEnabled(True)
+        self.sortByColumn(COL_PRICE, Qt.AscendingOrder)
+        self.setSelectionMode(QAbstractItemView.NoSelection)
+        self.setFocusPolicy(Qt.NoFocus)
+        self.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.verticalHeader().hide()
+        self.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.verticalHeader().setDefaultSectionSize(ROW_HEIGHT)
+
+        header = self.horizontalHeader()
+        header.setHighlightSections(False)
+        header.setSectionResizeMode(QHeaderView.Stretch)
+        header.setSectionResizeMode(COL_RANK, QHeaderView.Fixed)
+        self.setColumnWidth(COL_RANK, 60)
+        self.setStyleSheet("""
+            QTableView { background-color: #121212; border: none; }
+            QHeaderView::section {
+                background-color: #121212; color: #9E9E9E; border: none;
+                font-size: 11px; font-weight: bold; padding: 4px 14px;
+            }
+        """)
+        self.set_batch_mode(False)
+
+    def set_batch_mode(self, batch):
+        """The item column is only useful when several items share the table."""
+        self.setColumnHidden(COL_ITEM, not batch)
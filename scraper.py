@@ -1,18 +1,29 @@
 """
 Web scraping module to fetch CS2 item prices from various marketplaces.
 """
-import re
 import ssl
+import threading
+import time
 import urllib3
 import cloudscraper
-from bs4 import BeautifulSoup
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from requests.adapters import HTTPAdapter
-from config import TARGET_MARKETS
+from catalog import slugify
+from config import SCAN_CONCURRENCY, MAX_CONNECTIONS_PER_HOST, SLUG_CACHE_SIZE
+from extractor import parse_document, extract_offers, iter_offers
+from metrics import METRICS
+from parse_pool import ParsePool
+from rate_limiter import RequestScheduler, time_left
 
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
 class StrongSSLAdapter(HTTPAdapter):
     """Custom SSL Adapter to handle legacy or strict SSL handshakes."""
+    def __init__(self, *args, **kwargs):
+        self._sending = threading.local()  # Per thread: the adapter is shared by every scan worker
+        super().__init__(*args, **kwargs)
+
     def init_poolmanager(self, connections, maxsize, block=False, **pool_kwargs):
         context = ssl.create_default_context()
         context.check_hostname = False 
@@ -24,70 +35,210 @@ class StrongSSLAdapter(HTTPAdapter):
         pool_kwargs['ssl_context'] = context
         super().init_poolmanager(connections, maxsize, block=block, **pool_kwargs)
 
+    def get_connection_with_tls_context(self, request, verify, proxies=None, cert=None):
+        """Remembers the pool send() is about to use, and its connection count, for the reuse metrics."""
+        pool = super().get_connection_with_tls_context(request, verify, proxies=proxies, cert=cert)
+        self._sending.pool, self._sending.opened = pool, pool.num_connections
+        return pool
+
+    def send(self, request, **kwargs):
+        """Times every HTTP exchange, split by whether it reused a pooled connection or paid DNS/TLS."""
+        sending = self._sending
+        sending.pool = None
+        start = time.perf_counter()
+        try:
+            return super().send(request, **kwargs)
+        finally:
+            if sending.pool is not None:
+                reused = sending.pool.num_connections == sending.opened
+                METRICS.observe("http.send_reused" if reused else "http.send_new_connection",
+                                time.perf_counter() - start)
+                METRICS.cache("http.connection_reuse", reused)
+
+class ScrapeError(Exception):
+    """A scan that ended without offers: missing item, site error or no listings."""
+
 class SkinScraper:
     """Core scraper engine utilizing cloudscraper to bypass anti-bot protections."""
-    def __init__(self):
+    def __init__(self, pool_size=MAX_CONNECTIONS_PER_HOST, history=None, cache=None, base_url="https://csgoskins.gg/items",
+                 scheduler=None, parse_pool=None, catalog=None, adapters=None):
         self.scraper = cloudscraper.create_scraper(browser={'browser': 'chrome', 'platform': 'windows', 'mobile': False})
-        self.scraper.mount('https://', StrongSSLAdapter())
-        self.base_url = "https://csgoskins.gg/items"
+        # pool_block caps concurrent connections per host; idle ones are kept alive and reused
+        self.scraper.mount('https://', StrongSSLAdapter(pool_connections=4, pool_maxsize=pool_size, pool_block=True))
+        self.base_url = base_url.rstrip("/")
+        self.history = history  # Optional PriceHistory every successful scan is appended to, under item_name()
+        self.cache = cache      # Optional OfferCache of parsed results keyed by slug
+        self.scheduler = scheduler or RequestScheduler(max_concurrency=pool_size)
+        self.parse_pool = parse_pool or ParsePool()  # Batch scans parse in these processes
+        self.aggregator = None  # With extra market adapters, the csgoskins.gg page becomes one source of several
+        if adapters:
+            from markets import CsgoskinsAdapter, PriceAggregator
+            self.aggregator = PriceAggregator([CsgoskinsAdapter()] + list(adapters))
+        self.set_catalog(catalog)
+
+    def set_catalog(self, catalog):
+        """
+        Resolves names against an ItemCatalog's precomputed slugs from now on, rejecting
+        names it does not know. Without a (non-empty) catalog, slugs are guessed from the text.
+        """
+        self.catalog = catalog if catalog else None
+        self._slugs = lru_cache(maxsize=SLUG_CACHE_SIZE)(self._resolve)
+
+    def _resolve(self, raw_name):
+        if self.catalog is None: return slugify(raw_name)
+        return self.catalog.resolve_slugs(raw_name)
 
     def parse_input(self, raw_name):
-        """Formats the raw item name into a URL-friendly slug."""
-        is_stattrak = "StatTrak" in raw_name
-        is_souvenir = "Souvenir" in raw_name
-        
-        clean_name = raw_name.replace("★", "").replace("StatTrak™", "").replace("StatTrak", "").replace("Souvenir", "").strip()
-        
-        condition_slug = ""
-        conditions_map = {
-            "(Factory New)": "factory-new", "(Minimal Wear)": "minimal-wear",
-            "(Field-Tested)": "field-tested", "(Well-Worn)": "well-worn", "(Battle-Scarred)": "battle-scarred"
-        }
-        
-        for cond_text, slug in conditions_map.items():
-            if clean_name.endswith(cond_text):
-                condition_slug = slug
-                clean_name = clean_name[:-len(cond_text)].strip()
-                break
-                
-        clean_name = clean_name.replace("|", "").strip()
-        name_slug = re.sub(r'\s+', '-', clean_name).lower()
-        
-        if is_stattrak: name_slug = f"stattrak-{name_slug}"
-        if is_souvenir: name_slug = f"souvenir-{name_slug}"
-            
-        return name_slug, condition_slug
-
-    def fetch_prices(self, raw_name):
-        """Fetches pricing data from the target site."""
+        """Formats the raw item name into a URL-friendly slug; raises ScrapeError for unknown items."""
+        slugs = self._slugs(raw_name.strip())
+        if slugs is None:
+            METRICS.incr("scraper.unknown_item")
+            raise ScrapeError(f"Unknown item: {raw_name.strip()}\nNot found in the item catalog.")
+        return slugs
+
+    def item_name(self, raw_name):
+        """The name scans of `raw_name` are recorded under: the catalog's market hash name, else the typed text."""
+        name = self.catalog.canonical_name(raw_name) if self.catalog is not None else None
+        return name or raw_name.strip()
+
+    def item_url(self, raw_name):
         name_slug, condition_slug = self.parse_input(raw_name)
-        url = f"{self.base_url}/{name_slug}/{condition_slug}" if condition_slug else f"{self.base_url}/{name_slug}"
-            
+        return f"{self.base_url}/{name_slug}/{condition_slug}" if condition_slug else f"{self.base_url}/{name_slug}"
+
+    def cache_key(self, raw_name):
+        return "/".join(s for s in self.parse_input(raw_name) if s)
+
+    def cached_prices(self, raw_name):
+        """Returns (result, is_fresh) from the offer cache; result carries its age in 'cached_age'."""
+        if self.cache is None: return None, False
+        try: hit = self.cache.get(self.cache_key(raw_name))
+        except ScrapeError: return None, False
+        if hit is None: return None, False
+        result, age, fresh = hit
+        return dict(result, cached_age=age), fresh
+
+    def fetch_prices(self, raw_name, use_cache=True, parse=None):
+        """
+        Fetches pricing data from the target site (or a fresh cached copy of it).
+        `parse` maps raw page bytes to offers; by default the page is parsed in this thread.
+        """
+        if use_cache:
+            cached, fresh = self.cached_prices(raw_name)
+            if fresh: return cached
+
+        with METRICS.timer("scraper.fetch_prices"):
+            return self._fetch(raw_name, parse)
+
+    def _request(self, url, stream=False, deadline=None):
+        """
+        Scheduled GET of an item page; raises ScrapeError for anything but a 200. With a
+        `deadline` (time.monotonic()) the request is not retried and must finish by then.
+        """
+        send = lambda: self.scraper.get(url, timeout=max(0.01, time_left(deadline, 20)), stream=stream)
+        response = self.scheduler.request(url, send, deadline=deadline, retries=None if deadline is None else 0)
+        METRICS.observe("scraper.ttfb", response.elapsed.total_seconds())
+        METRICS.incr(f"scraper.status.{response.status_code}")
+        if response.history: METRICS.incr("scraper.challenge_or_redirect")
+        if response.status_code == 404: 
+            response.close(); raise ScrapeError(f"Item not found!\n{url}")
+        elif response.status_code != 200: 
+            response.close(); raise ScrapeError(f"Site Error: {response.status_code}")
+        return response
+
+    def _store(self, raw_name, offers, partial=False):
+        if self.history is not None:
+            try: self.history.record(self.item_name(raw_name), offers)
+            except Exception as e: METRICS.error("price_history", e); print(f"PriceHistory Error: {e}")
+        if self.cache is not None:
+            # A scan some source failed in is kept only as a stale copy, so the next one refetches
+            self.cache.put(self.cache_key(raw_name), {"offers": offers}, fresh=not partial)
+
+    def page_offers(self, raw_name, parse=None, deadline=None):
+        """Downloads and parses the item's csgoskins.gg page; raises ScrapeError on a failed request."""
+        url = self.item_url(raw_name)
+        with METRICS.timer("scraper.download"):
+            content = self._request(url, deadline=deadline).content
+
+        if parse is not None:
+            with METRICS.timer("scraper.parse_remote"):
+                return parse(content)
+        with METRICS.timer("scraper.parse"):
+            soup = parse_document(content)
+        with METRICS.timer("scraper.extract"):
+            return extract_offers(soup)
+
+    def _fetch(self, raw_name, parse=None):
         try:
-            response = self.scraper.get(url, timeout=20)
-            if response.status_code == 404: 
-                return {"error": f"Item not found!\n{url}"}
-            elif response.status_code != 200: 
-                return {"error": f"Site Error: {response.status_code}"}
-
-            soup = BeautifulSoup(response.content, "html.parser")
-            offers = []
-            page_text = soup.get_text()
-
-            for market in TARGET_MARKETS:
-                if market.lower() not in page_text.lower(): continue
-                market_tag = soup.find(string=lambda t: t and market.lower() in t.lower())
-                if market_tag:
-                    container = market_tag.find_parent("div") or market_tag.find_parent("tr")
-                    if container:
-                        price_tag = container.find_next(string=lambda t: t and "$" in t)
-                        if not price_tag and container.find_parent():
-                             price_tag = container.find_parent().find_next(string=lambda t: t and "$" in t)
-                        if price_tag:
-                            try:
-                                p_val = float(price_tag.strip().replace("$", "").replace(",", ""))
-                                offers.append({"site": market, "price": p_val})
-                            except ValueError: continue
-            return {"offers": offers} if offers else {"error": "No listings found."}
+            if self.aggregator is not None:
+                self.parse_input(raw_name)  # Unknown items fail once here, not once per source
+                result = self.aggregator.fetch(self, raw_name, parse)
+                if "offers" in result: self._store(raw_name, result["offers"], result.get("partial", False))
+                return result
+            offers = self.page_offers(raw_name, parse)
+            if not offers: return {"error": "No listings found."}
+            self._store(raw_name, offers)
+            return {"offers": offers}
+        except ScrapeError as e:
+            return {"error": str(e)}
         except Exception as e: 
-            return {"error": str(e)}
\ No newline at end of file
+            METRICS.error("scraper", e)
+            return {"error": str(e)}
+
+    def iter_prices(self, raw_name):
+        """
+        Streaming variant of fetch_prices: yields each offer as soon as it is parsed from
+        the still-downloading page, or with several sources, each new or fresher market
+        quote as its source answers (a later offer for a market supersedes the earlier one).
+        Raises ScrapeError if the scan ends without offers.
+        """
+        if self.aggregator is not None:
+            yield from self._iter_sources(raw_name); return
+        url = self.item_url(raw_name)
+        offers = []
+        start = time.perf_counter()
+        response = self._request(url, stream=True)
+        try:
+            for offer in iter_offers(response.iter_content(chunk_size=16 * 1024)):
+                if not offers: METRICS.observe("scraper.first_offer", time.perf_counter() - start)
+                offers.append(offer)
+                yield offer
+        finally:
+            response.close()
+        METRICS.observe("scraper.iter_prices", time.perf_counter() - start)
+        if not offers: raise ScrapeError("No listings found.")
+        self._store(raw_name, offers)
+
+    def _iter_sources(self, raw_name):
+        from markets import merge_offers
+        self.parse_input(raw_name)
+        merged, errors = {}, []
+        for adapter, offers, error in self.aggregator.stream(self, raw_name):
+            if error: errors.append(error)
+            yield from merge_offers(merged, offers or ())
+        if not merged: raise ScrapeError("\n".join(errors) or "No listings found.")
+        self._store(raw_name, list(merged.values()), partial=bool(errors))
+
+    def scan_many(self, names, max_workers=SCAN_CONCURRENCY, use_cache=True):
+        """
+        Fetches many items through a bounded thread pool, yielding (name, result) as each one finishes.
+        Downloads stay on the threads; pages are parsed in the parse pool's processes.
+        """
+        names = list(dict.fromkeys(n for n in names if n))
+        pool = ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="scan")
+        try:
+            futures = {pool.submit(self.fetch_prices, n, use_cache, self.parse_pool.parse): n for n in names}
+            for fut in as_completed(futures):
+                yield futures[fut], fut.result()
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def close(self):
+        if self.aggregator is not None: self.aggregator.close()
+        self.parse_pool.close()
+        if self.cache is not None: self.cache.close()
+        self.scraper.close()
+
+
+def read_watchlist(lines):
+    """Extracts item names from watchlist lines, skipping blanks and '#' comments."""
+    return [l.strip() for l in lines if l.strip() and not l.lstrip().startswith("#")]
@@ -0,0 +1,67 @@
+"""
+Prebuilt n-gram inverted index powering the autocomplete suggestions.
+"""
+from array import array
+from itertools import islice
+
+
+def _grams(text):
+    """Index keys for a lowercased string: every bigram and trigram it contains."""
+    keys = {text[i:i + 3] for i in range(len(text) - 2)}
+    keys.update(text[i:i + 2] for i in range(len(text) - 1))
+    return keys
+
+
+def _query_grams(word):
+    """The most selective keys for one query word (trigrams, or the word itself if it is a bigram)."""
+    if len(word) >= 3: return {word[i:i + 3] for i in range(len(word) - 2)}
+    if len(word) == 2: return {word}
+    return set()
+
+
+class SearchIndex:
+    """Trigram/bigram inverted index over an ItemCatalog; results are ordered shortest name first."""
+    def __init__(self, catalog):
+        # Doc ids follow (name length, catalog position), so the smallest ids are the best matches
+        self.catalog = catalog
+        self.order = array("I", sorted(range(len(catalog)), key=lambda i: len(catalog.name(i))))
+        self.names = [catalog.name(i).lower() for i in self.order]
+        postings = {}
+        for doc_id, name in enumerate(self.names):
+            for key in _grams(name):
+                postings.setdefault(key, []).append(doc_id)
+        # Posting lists stay in ascending id (= rank) order; sets back the membership tests
+        self.postings = {key: tuple(ids) for key, ids in postings.items()}
+        self.posting_sets = {key: frozenset(ids) for key, ids in postings.items()}
+
+    def __len__(self):
+        return len(self.order)
+
+    def entry(self, doc_id):
+        return self.catalog.entry(self.order[doc_id])
+
+    def hits(self, query, within=None):
+        """
+        Lazily yields the doc ids whose name contains every word of the query, in rank order.
+        `within` (ascending doc ids, e.g. a previous query's hits) restricts the candidates.
+        """
+        words = query.lower().split()
+        if not words: return iter(())
+        names = self.names
+        if within is not None:
+            return (i for i in within if all(w in names[i] for w in words))
+
+        keys = set()
+        for word in words: keys |= _query_grams(word)
+        if any(key not in self.postings for key in keys): return iter(())
+
+        # Walk the shortest posting list in rank order, probing the others
+        keys = sorted(keys, key=lambda k: len(self.postings[k]))
+        candidates = self.postings[keys[0]] if keys else range(len(names))
+        others = [self.posting_sets[k] for k in keys[1:]]
+        return (i for i in candidates
+                if all(i in s for s in others) and all(w in names[i] for w in words))
+
+    def search(self, query, limit=25):
+        """Returns up to `limit` {'name', 'image'} entries whose name contains every word of the query."""
+        return [self.entry(i) for i in islice(self.hits(query), limit)]
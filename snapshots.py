@@ -0,0 +1,222 @@
+"""
+Columnar snapshots of scan results (item, market, price, ts, profit) for offline analysis.
+
+The format follows the file extension: .parquet and .arrow/.feather need pyarrow; .npz
+(uncompressed, dictionary-encoded strings, one array set per chunk) and .csv always work.
+Writers stream fixed-size chunks; readers memory-map wherever the format allows.
+"""
+import csv
+import math
+import os
+import time
+import zipfile
+
+import numpy as np
+from config import SNAPSHOT_CHUNK_ROWS
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+COLUMNS = ("item", "market", "price", "ts", "profit")
+ARROW_EXTENSIONS = (".parquet", ".arrow", ".feather")
+SNAPSHOT_EXTENSIONS = ARROW_EXTENSIONS + (".npz", ".csv") if pa is not None else (".npz", ".csv")
+DEFAULT_EXTENSION = ".parquet" if pa is not None else ".npz"
+
+
+def _extension(path):
+    ext = os.path.splitext(path)[1].lower()
+    if ext not in (".parquet", ".arrow", ".feather", ".npz", ".csv"):
+        raise ValueError(f"Unsupported snapshot format: {ext or path}")
+    if ext in ARROW_EXTENSIONS and pa is None:
+        raise ValueError(f"{ext} snapshots need pyarrow (pip install pyarrow); use .npz or .csv instead")
+    return ext
+
+
+class SnapshotWriter:
+    """
+    Appends fetch_prices results as rows and writes them out every `chunk_rows` rows,
+    so memory stays bounded however long the scan. Use as a context manager.
+    """
+    def __init__(self, path, chunk_rows=SNAPSHOT_CHUNK_ROWS):
+        self.path = path
+        self.ext = _extension(path)
+        self.chunk_rows = chunk_rows
+        self.rows = 0
+        self._chunks = 0
+        self._buffer = {c: [] for c in COLUMNS}
+        self._vocab = {"item": {}, "market": {}}  # .npz dictionary encoding
+        self._sink = None
+        self._open()
+
+    def _open(self):
+        if self.ext == ".csv":
+            self._file = open(self.path, "w", encoding="utf-8", newline="")
+            self._sink = csv.writer(self._file)
+            self._sink.writerow(COLUMNS)
+        elif self.ext == ".npz":
+            self._sink = zipfile.ZipFile(self.path, "w", zipfile.ZIP_STORED, allowZip64=True)
+        else:
+            self._schema = pa.schema([("item", pa.string()), ("market", pa.string()), ("price", pa.float64()),
+                                      ("ts", pa.float64()), ("profit", pa.float64())])
+            if self.ext == ".parquet":
+                self._sink = pq.ParquetWriter(self.path, self._schema, compression="zstd")
+            else:
+                self._sink = pa.ipc.new_file(self.path, self._schema)
+
+    def write(self, item, result, net_income=0.0, ts=None):
+        """Adds one item's offers, stamped with their own 'ts' if they carry one; failed results are skipped."""
+        ts = time.time() if ts is None else ts
+        for offer in result.get("offers", ()):
+            self.add_row(item, offer['site'], offer['price'], offer.get('ts', ts),
+                         net_income - offer['price'] if net_income > 0 else math.nan)
+
+    def add_row(self, item, market, price, ts, profit=math.nan):
+        b = self._buffer
+        b["item"].append(item); b["market"].append(market); b["price"].append(price)
+        b["ts"].append(ts); b["profit"].append(profit)
+        if len(b["price"]) >= self.chunk_rows: self.flush()
+
+    def flush(self):
+        b = self._buffer
+        n = len(b["price"])
+        if not n: return
+        if self.ext == ".csv":
+            self._sink.writerows(zip(*(b[c] for c in COLUMNS)))
+            self._file.flush()
+        elif self.ext == ".npz":
+            arrays = {f"{c}_code": np.fromiter((self._vocab[c].setdefault(v, len(self._vocab[c])) for v in b[c]),
+                                               dtype=np.int32, count=n) for c in ("item", "market")}
+            arrays.update({c: np.asarray(b[c], dtype=np.float64) for c in ("price", "ts", "profit")})
+            for name, array in arrays.items(): self._write_member(f"{name}.{self._chunks:06d}", array)
+        else:
+            batch = pa.record_batch([pa.array(b[c], type=self._schema.field(c).type) for c in COLUMNS],
+                                    schema=self._schema)
+            self._sink.write_batch(batch)  # one Parquet row group / IPC record batch per chunk
+        self.rows += n
+        self._chunks += 1
+        for column in b.values(): column.clear()
+
+    def _write_member(self, name, array):
+        with self._sink.open(f"{name}.npy", "w", force_zip64=True) as f:
+            np.lib.format.write_array(f, np.ascontiguousarray(array), allow_pickle=False)
+
+    def close(self):
+        if self._sink is None: return
+        self.flush()
+        if self.ext == ".csv":
+            self._file.close()
+        elif self.ext == ".npz":
+            for c in ("item", "market"):
+                self._write_member(f"{c}_vocab", np.array(list(self._vocab[c]) or [""], dtype=str))
+            self._sink.close()
+        else:
+            self._sink.close()
+        self._sink = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def export_results(path, results, net_income=0.0, chunk_rows=SNAPSHOT_CHUNK_ROWS):
+    """Streams (item, fetch_prices result) pairs into a snapshot; returns the number of rows written."""
+    with SnapshotWriter(path, chunk_rows) as writer:
+        for item, result in results: writer.write(item, result, net_income)
+    return writer.rows
+
+
+def _npz_members(path):
+    """Memory-maps every array of an uncompressed .npz; {member name: array}. ValueError if it is not one."""
+    try:
+        return _read_npz_members(path)
+    except zipfile.BadZipFile as e:
+        raise ValueError(f"Not a valid .npz snapshot: {e}") from e
+
+
+def _read_npz_members(path):
+    arrays = {}
+    with zipfile.ZipFile(path) as zf, open(path, "rb") as f:
+        for info in zf.infolist():
+            name = info.filename[:-4] if info.filename.endswith(".npy") else info.filename
+            if info.compress_type != zipfile.ZIP_STORED:
+                arrays[name] = np.load(zf.open(info), allow_pickle=False); continue
+            # Local file header: 30 fixed bytes, then the name and extra field
+            f.seek(info.header_offset + 26)
+            name_len, extra_len = np.frombuffer(f.read(4), dtype="<u2")
+            f.seek(info.header_offset + 30 + int(name_len) + int(extra_len))
+            version = np.lib.format.read_magic(f)
+            if version == (1, 0): shape, fortran, dtype = np.lib.format.read_array_header_1_0(f)
+            else: shape, fortran, dtype = np.lib.format.read_array_header_2_0(f)
+            if not shape or 0 in shape:
+                arrays[name] = np.empty(shape, dtype=dtype)
+            else:
+                arrays[name] = np.memmap(path, dtype=dtype, mode="r", offset=f.tell(), shape=shape,
+                                         order="F" if fortran else "C")
+    return arrays
+
+
+def iter_snapshot(path):
+    """
+    Yields the snapshot chunk by chunk as {column: sequence}; price, ts and profit are
+    NumPy arrays (memory-mapped for .npz and .arrow), item and market are string sequences.
+    """
+    ext = _extension(path)
+    if ext == ".csv":
+        with open(path, encoding="utf-8", newline="") as f:
+            reader = csv.reader(f)
+            next(reader, None)
+            while True:
+                rows = [r for _, r in zip(range(SNAPSHOT_CHUNK_ROWS), reader)]
+                if not rows: return
+                item, market, price, ts, profit = zip(*rows)
+                yield {"item": item, "market": market, "price": np.asarray(price, dtype=np.float64),
+                       "ts": np.asarray(ts, dtype=np.float64), "profit": np.asarray(profit, dtype=np.float64)}
+    elif ext == ".npz":
+        arrays = _npz_members(path)
+        vocab = {c: arrays[f"{c}_vocab"] for c in ("item", "market")}
+        chunks = sorted({name.rsplit(".", 1)[1] for name in arrays if name.startswith("price.")})
+        for chunk in chunks:
+            out = {c: arrays[f"{c}.{chunk}"] for c in ("price", "ts", "profit")}
+            out.update({c: vocab[c][arrays[f"{c}_code.{chunk}"]] for c in ("item", "market")})
+            yield out
+    elif ext == ".parquet":
+        for batch in pq.ParquetFile(path, memory_map=True).iter_batches(batch_size=SNAPSHOT_CHUNK_ROWS):
+            yield _batch_columns(batch)
+    else:
+        reader = pa.ipc.open_file(pa.memory_map(path, "r"))
+        for i in range(reader.num_record_batches):
+            yield _batch_columns(reader.get_batch(i))
+
+
+def _batch_columns(batch):
+    out = {}
+    for c in COLUMNS:
+        column = batch.column(c)
+        out[c] = column.to_pylist() if c in ("item", "market") else column.to_numpy(zero_copy_only=False)
+    return out
+
+
+def read_columns(path):
+    """The whole snapshot as {column: NumPy array}, ready for pandas.DataFrame(...)."""
+    chunks = list(iter_snapshot(path))
+    if not chunks: return {c: np.array([], dtype=str if c in ("item", "market") else np.float64) for c in COLUMNS}
+    return {c: np.concatenate([np.asarray(chunk[c]) for chunk in chunks]) for c in COLUMNS}
+
+
+def latest_offers(path):
+    """{item: offers} from a snapshot, keeping the newest quote (with its 'ts') per item and market."""
+    newest = {}
+    for chunk in iter_snapshot(path):
+        for item, market, price, ts in zip(chunk["item"], chunk["market"], chunk["price"].tolist(), chunk["ts"].tolist()):
+            key = (str(item), str(market))
+            if key not in newest or ts >= newest[key][1]: newest[key] = (price, ts)
+    results = {}
+    for (item, market), (price, ts) in newest.items():
+        results.setdefault(item, []).append({"site": market, "price": price, "ts": ts})
+    return results
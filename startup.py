@@ -0,0 +1,66 @@
+"""
+Cold-start support: phase timings for the startup report and warm-up threads that
+build expensive objects (and import their modules) after the window is on screen.
+"""
+import sys
+import threading
+import time
+from concurrent.futures import Future
+from contextlib import contextmanager
+from metrics import METRICS
+
+
+class StartupTimer:
+    """Records (phase, start, end) offsets from construction, which happens as early as main.py can manage."""
+    def __init__(self):
+        self.t0 = time.perf_counter()
+        self.phases = []
+        self._lock = threading.Lock()
+
+    def record(self, name, start, end=None):
+        end = time.perf_counter() if end is None else end
+        with self._lock:
+            self.phases.append((name, start - self.t0, end - self.t0))
+        METRICS.observe(f"startup.{name}", end - start)
+
+    @contextmanager
+    def phase(self, name):
+        start = time.perf_counter()
+        try: yield
+        finally: self.record(name, start)
+
+    def mark(self, name):
+        """A point-in-time milestone (e.g. first paint), timed from process start."""
+        self.record(name, self.t0)
+
+    def report(self):
+        with self._lock:
+            phases = sorted(self.phases, key=lambda p: p[2])
+        lines = ["startup phases (ms since launch):"]
+        lines += [f"  {name:<24} {start * 1000:8.1f} -> {end * 1000:8.1f}  ({(end - start) * 1000:7.1f})"
+                  for name, start, end in phases]
+        return "\n".join(lines)
+
+    def print_report(self, stream=sys.stderr):
+        print(self.report(), file=stream)
+
+
+STARTUP = StartupTimer()
+
+
+def warm_up(name, factory):
+    """Calls factory() on a daemon thread and returns a Future of the result; the call is a startup phase."""
+    future = Future()
+
+    def run():
+        future.set_running_or_notify_cancel()
+        try:
+            with STARTUP.phase(name): result = factory()
+        except BaseException as e:
+            METRICS.error("startup", e)
+            future.set_exception(e)
+        else:
+            future.set_result(result)
+
+    threading.Thread(target=run, name=f"warmup-{name}", daemon=True).start()
+    return future
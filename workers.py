@@ -1,83 +1,254 @@
 """
 PyQt QThread workers to handle asynchronous tasks like API calls and image loading.
 """
-import requests
-from PyQt5.QtCore import QThread, pyqtSignal
+import asyncio
+import json
+import threading
+import time
+from PyQt5.QtCore import Qt, QObject, QThread, QSize, pyqtSignal
+from PyQt5.QtGui import QImage
+from config import SCAN_CONCURRENCY, CATALOG_URL, ICON_FETCH_WORKERS, STREAM_RESULTS, ALERT_WEBHOOK_URL
+from item_store import ItemStore, process_catalog
+from metrics import METRICS
+from monitor import AlertEngine, PollSchedule
+from search_index import SearchIndex
 
 class ScraperWorker(QThread):
-    """Executes the scraping process in the background."""
+    """
+    Executes the scraping process in the background. A fresh cached result is emitted
+    straight away; a stale one is emitted with 'stale' set, then replaced by a refetch.
+    In streaming mode every offer is also emitted through offer_ready as it is parsed.
+    """
     result_ready = pyqtSignal(dict)
+    offer_ready = pyqtSignal(dict)
     
-    def __init__(self, scraper, name):
+    def __init__(self, scraper, name, streaming=STREAM_RESULTS):
         super().__init__()
         self.scraper = scraper
         self.name = name
+        self.streaming = streaming
+        self.is_cancelled = False
         
     def run(self):
-        res = self.scraper.fetch_prices(self.name)
+        cached, fresh = self.scraper.cached_prices(self.name)
+        if cached is not None:
+            self.result_ready.emit(cached if fresh else dict(cached, stale=True))
+            if fresh: return
+        res = self.stream() if self.streaming else self.scraper.fetch_prices(self.name, use_cache=False)
+        if self.is_cancelled: return
+        if cached is not None and "error" in res:
+            res = cached  # Keep showing the last good result if the refresh failed
         self.result_ready.emit(res)
 
-class DBWorker(QThread):
-    """Fetches the comprehensive item database from the public API."""
-    db_ready = pyqtSignal(list)
-    
-    def run(self):
+    def stream(self):
+        from scraper import ScrapeError  # Already loaded by the time a scraper exists
+        offers = {}  # market -> latest offer; with several sources a fresher quote replaces an earlier one
+        stream = self.scraper.iter_prices(self.name)
         try:
-            url = "https://raw.githubusercontent.com/ByMykel/CSGO-API/main/public/api/en/all.json"
-            response = requests.get(url, timeout=10)
-            if response.status_code == 200:
-                data = response.json()
-                temp_db = {}
-                for item in data.values():
-                    if isinstance(item, dict) and 'name' in item:
-                        clean_name = item['name'].replace("★ ", "").strip()
-                        if clean_name not in temp_db:
-                            image_url = item.get('image') or item.get('image_url') or item.get('icon_url') or ""
-                            temp_db[clean_name] = image_url
-                
-                db_list = [{'name': k, 'image': v} for k, v in temp_db.items()]
-                self.db_ready.emit(db_list)
-        except Exception as e: 
-            print(f"DBWorker Error: {e}")
+            for offer in stream:
+                if self.is_cancelled: break
+                offers[offer['site']] = offer
+                self.offer_ready.emit(offer)
+        except ScrapeError as e:
+            return {"error": str(e)}
+        except Exception as e:
+            METRICS.error("scraper", e)
+            return {"error": str(e)}
+        finally:
+            stream.close()  # Stops the download if the scan was cancelled mid-page
+        return {"offers": list(offers.values())}
 
-class IconLoader(QThread):
-    """Asynchronously loads multiple thumbnail icons for autocomplete suggestions."""
-    icon_loaded = pyqtSignal(int, str, bytes)
-    
-    def __init__(self, requests_list, cache):
+    def cancel(self):
+        """Stops streaming at the next offer; no result is emitted after that."""
+        self.is_cancelled = True
+
+class BatchScraperWorker(QThread):
+    """Scans a whole watchlist through the scraper's bounded fetch pool, streaming each result."""
+    item_ready = pyqtSignal(str, dict)
+    progress = pyqtSignal(int, int)
+
+    def __init__(self, scraper, names, max_workers=SCAN_CONCURRENCY):
         super().__init__()
-        self.requests_list = requests_list
-        self.cache = cache
+        self.scraper = scraper
+        self.names = list(dict.fromkeys(names))
+        self.max_workers = max_workers
         self.is_cancelled = False
-        
+
     def run(self):
-        headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64)'}
-        for idx, url in self.requests_list:
-            if self.is_cancelled: return
-            if url in self.cache:
-                self.icon_loaded.emit(idx, url, self.cache[url])
-                continue
-            try:
-                resp = requests.get(url, headers=headers, timeout=3)
-                if resp.status_code == 200:
-                    self.icon_loaded.emit(idx, url, resp.content)
-            except Exception: pass
-            
-    def cancel(self): 
+        total = len(self.names)
+        results = self.scraper.scan_many(self.names, self.max_workers)
+        try:
+            for done, (name, res) in enumerate(results, 1):
+                if self.is_cancelled: return
+                self.item_ready.emit(name, res)
+                self.progress.emit(done, total)
+        finally:
+            results.close()
+
+    def cancel(self):
         self.is_cancelled = True
 
-class SingleImageLoader(QThread):
-    """Fetches a single high-resolution image for the header preview."""
-    loaded = pyqtSignal(bytes)
-    
-    def __init__(self, url):
+class MonitorWorker(QThread):
+    """
+    Continuous background scanning of the items of a rule set. Polls go through the
+    scraper's fetch pool as they fall due; each fresh offer set feeds the alert engine,
+    and alerts are emitted (and POSTed to the webhook, if one is configured).
+    """
+    item_ready = pyqtSignal(str, dict)
+    alert = pyqtSignal(dict)
+
+    def __init__(self, scraper, rules, webhook=ALERT_WEBHOOK_URL, max_workers=SCAN_CONCURRENCY):
         super().__init__()
-        self.url = url
-        
+        self.scraper = scraper
+        self.rules = list(rules)
+        self.webhook = webhook
+        self.max_workers = max_workers
+        self._stop = threading.Event()
+
     def run(self):
+        engine = AlertEngine(self.rules)
+        schedule = PollSchedule(engine, [r.item for r in self.rules])
+        while not self._stop.is_set():
+            due = schedule.due()
+            if not due:
+                self._stop.wait(max(0.0, schedule.next_due() - time.time())); continue
+            results = self.scraper.scan_many(due, self.max_workers, use_cache=False)
+            try:
+                for name, res in results:
+                    if self._stop.is_set(): return
+                    if "offers" in res:
+                        for alert in engine.update(name, res["offers"]): self.notify(alert)
+                    schedule.reschedule(name)
+                    self.item_ready.emit(name, res)
+            finally:
+                results.close()
+
+    def notify(self, alert):
+        self.alert.emit(alert)
+        if not self.webhook: return
+        import requests
         try:
-            headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64)'}
-            resp = requests.get(self.url, headers=headers, timeout=5)
-            if resp.status_code == 200:
-                self.loaded.emit(resp.content)
-        except Exception: pass
\ No newline at end of file
+            requests.post(self.webhook, json=alert, timeout=3)
+            METRICS.incr("monitor.webhook_sent")
+        except requests.RequestException as e:
+            METRICS.error("monitor.webhook", e)
+
+    def cancel(self):
+        self._stop.set()
+
+class DBWorker(QThread):
+    """
+    Serves the item database from the local store first, then revalidates it against
+    the public API (ETag / If-Modified-Since) and re-emits only if upstream changed.
+    The request itself runs on the network core; this thread does the CPU-bound work.
+    """
+    db_ready = pyqtSignal(object)
+    index_ready = pyqtSignal(object)
+
+    def __init__(self, core, store=None):
+        super().__init__()
+        self.core = core
+        self.store = store or ItemStore()
+
+    def publish(self, catalog):
+        self.db_ready.emit(catalog)
+        self.index_ready.emit(SearchIndex(catalog))
+
+    def run(self):
+        with METRICS.timer("db.load_local"):
+            cached = self.store.load()
+        if cached:
+            with METRICS.timer("db.publish"): self.publish(cached)
+
+        try:
+            headers = {}
+            etag, last_modified = self.store.validators() if cached else (None, None)
+            if etag: headers['If-None-Match'] = etag
+            if last_modified: headers['If-Modified-Since'] = last_modified
+
+            with METRICS.timer("db.refresh_request"):
+                response = self.core.run(self.core.get(CATALOG_URL, headers=headers, timeout=10))
+            METRICS.incr(f"db.status.{response.status}")
+            if response.status == 200:
+                with METRICS.timer("db.process"):
+                    catalog = process_catalog(json.loads(response.content))
+                    self.store.save(catalog, response.headers.get('ETag'), response.headers.get('Last-Modified'))
+                if catalog != cached:
+                    with METRICS.timer("db.publish"): self.publish(catalog)
+        except Exception as e: 
+            METRICS.error("db", e)
+            print(f"DBWorker Error: {e}")
+
+ICON_SIZE = (50, 38)
+HEADER_IMAGE_SIZE = (130, 90)
+
+def decode_thumbnail(cache, url, size, data):
+    """Decodes and downscales image bytes into a QImage, remembering it in the thumbnail tier."""
+    with METRICS.timer("images.decode"):
+        image = QImage.fromData(data)
+        if image.isNull(): return None
+        image = image.scaled(QSize(*size), Qt.KeepAspectRatio, Qt.SmoothTransformation)
+    cache.put_thumbnail(url, size, image, image.sizeInBytes())
+    return image
+
+async def load_thumbnail(core, cache, url, size, timeout):
+    """Returns a downscaled QImage for `url`, using the shared cache at every tier."""
+    image = cache.get_thumbnail(url, size)
+    if image is not None: return image
+
+    data = await core.run_blocking(cache.get, url)
+    if data is None:
+        with METRICS.timer("images.download"):
+            resp = await core.get(url, timeout=timeout)
+        if resp.status != 200:
+            METRICS.incr(f"images.status.{resp.status}"); return None
+        data = resp.content
+        await core.run_blocking(cache.put, url, data)
+    return await core.run_blocking(decode_thumbnail, cache, url, size, data)
+
+class IconLoader(QObject):
+    """
+    Thumbnail fetch service for the autocomplete list, running as coroutines on the network
+    core. At most `max_workers` downloads run at once, started lowest row (visible) first;
+    URLs already loading are not refetched, and ones a newer request drops are cancelled.
+    """
+    icon_loaded = pyqtSignal(int, str, QImage)
+
+    def __init__(self, core, cache, max_workers=ICON_FETCH_WORKERS):
+        super().__init__()
+        self.core = core
+        self.cache = cache
+        self.max_workers = max_workers
+        self._slots = None      # asyncio.Semaphore, created on the loop
+        self._pending = {}      # url -> concurrent future
+        self._rows = {}         # url -> rows of the current request waiting for it
+
+    def request(self, requests_list):
+        """Replaces all pending work with [(row, url), ...]."""
+        rows = {}
+        for row, url in sorted(requests_list):
+            rows.setdefault(url, []).append(row)
+        for url in [u for u in self._pending if u not in rows]:
+            if self._pending.pop(url).cancel(): METRICS.incr("icons.dropped")
+        self._rows = rows
+        for url in rows:
+            if url not in self._pending:
+                self._pending[url] = self.core.submit(
+                    self._load(url), lambda image, error, url=url: self._loaded(url, image, error))
+
+    def cancel(self):
+        self.request([])
+
+    async def _load(self, url):
+        if self._slots is None: self._slots = asyncio.Semaphore(self.max_workers)
+        async with self._slots:
+            with METRICS.timer("icons.load"):
+                return await load_thumbnail(self.core, self.cache, url, ICON_SIZE, timeout=3)
+
+    def _loaded(self, url, image, error):
+        future = self._pending.get(url)
+        if future is not None and future.done(): del self._pending[url]
+        if error is not None:
+            METRICS.error("icons", error); return
+        if image is not None:
+            for row in self._rows.get(url, ()): self.icon_loaded.emit(row, url, image)